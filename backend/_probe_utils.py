@@ -0,0 +1,111 @@
+"""Shared helpers for the model probe scripts."""
+import base64
+import os
+from pathlib import Path
+
+import httpx
+from anthropic import Anthropic, AsyncAnthropic, DefaultAsyncHttpxClient, DefaultHttpxClient
+from dotenv import load_dotenv
+
+# One keep-alive pool per script so TLS is negotiated once and reused
+# across probes
+PROBE_LIMITS = httpx.Limits(
+    max_keepalive_connections=20,
+    max_connections=100,
+    keepalive_expiry=30.0,
+)
+PROBE_TIMEOUT = 30.0
+# The SDK retries 429s and transient errors with exponential backoff,
+# honouring retry-after; allow a few more attempts than its default of 2 so
+# a brief rate limit doesn't show up as a missing model
+PROBE_MAX_RETRIES = 4
+
+# The probe PDF never changes, so build it once and reuse the encoded copy
+PROBE_PDF_PATH = Path(__file__).parent / 'tests' / 'fixtures' / 'probe.pdf.b64'
+
+
+def load_api_key():
+    """Load .env and return ANTHROPIC_API_KEY, or None if unset."""
+    load_dotenv()
+    return os.getenv('ANTHROPIC_API_KEY')
+
+
+def describe_api_key(api_key):
+    """Return a display line for the API key without revealing all of it."""
+    return f"API Key: {api_key[:20]}..." if api_key else "API Key: NOT SET"
+
+
+def classify_error(error):
+    """
+    Classify a failed probe from its error message.
+
+    Returns one of 'not_found', 'unauthorized', 'rate_limited', 'no_pdf'
+    or 'other'.
+    """
+    error_str = str(error)
+    if '404' in error_str or 'not_found' in error_str:
+        return 'not_found'
+    if '401' in error_str or 'unauthorized' in error_str:
+        return 'unauthorized'
+    if '429' in error_str or 'rate_limit' in error_str:
+        return 'rate_limited'
+    if 'does not support PDF' in error_str or 'document' in error_str.lower():
+        return 'no_pdf'
+    return 'other'
+
+
+def pdf_probe_messages(pdf_base64, question):
+    """Build the messages for a PDF probe request."""
+    return [{
+        "role": "user",
+        "content": [
+            {
+                "type": "document",
+                "source": {
+                    "type": "base64",
+                    "media_type": "application/pdf",
+                    "data": pdf_base64,
+                },
+            },
+            {"type": "text", "text": question}
+        ]
+    }]
+
+
+def create_probe_client(api_key):
+    """Create an Anthropic client backed by a pooled HTTP client."""
+    return Anthropic(
+        api_key=api_key,
+        max_retries=PROBE_MAX_RETRIES,
+        http_client=DefaultHttpxClient(limits=PROBE_LIMITS, timeout=PROBE_TIMEOUT),
+    )
+
+
+def create_async_probe_client(api_key):
+    """Create an AsyncAnthropic client backed by a pooled HTTP client."""
+    return AsyncAnthropic(
+        api_key=api_key,
+        max_retries=PROBE_MAX_RETRIES,
+        http_client=DefaultAsyncHttpxClient(limits=PROBE_LIMITS, timeout=PROBE_TIMEOUT),
+    )
+
+
+def get_probe_pdf_b64():
+    """Return the base64 probe PDF, building and caching it on first use."""
+    if PROBE_PDF_PATH.exists():
+        return PROBE_PDF_PATH.read_text()
+    return _build_and_cache(PROBE_PDF_PATH)
+
+
+def _build_and_cache(path):
+    """Build a one-page test PDF and write its base64 encoding to path."""
+    import fitz
+    doc = fitz.open()
+    page = doc.new_page()
+    page.insert_text((50, 50), "Test PDF")
+    pdf_bytes = doc.tobytes()
+    doc.close()
+
+    pdf_base64 = base64.b64encode(pdf_bytes).decode('utf-8')
+    path.write_text(pdf_base64)
+    return pdf_base64
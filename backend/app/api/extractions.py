@@ -22,7 +22,7 @@ from app.schemas.pydantic_schemas import (
     FieldDefinition,
 )
 from app.schemas.field_schema import LEASE_FIELDS, FieldCategory, get_field_by_path
-from app.services.storage_service import storage_service
+from app.services.storage_service import get_storage_service
 from app.services.claude_service import claude_service
 from app.services.validation_service import validation_service
 from app.services.pdf_service import pdf_service
@@ -87,7 +87,7 @@ async def extract_lease_data(
     try:
         # Stage: Extracting text from PDF
         tracker.advance_stage(ExtractionStage.EXTRACTING_TEXT)
-        pdf_bytes = storage_service.download_pdf(lease.file_path)
+        pdf_bytes = await get_storage_service().download_pdf_async(lease.file_path)
 
         # Stage: AI Analyzing
         tracker.advance_stage(ExtractionStage.ANALYZING)
@@ -160,40 +160,41 @@ async def extract_lease_data(
 
         # Enrich citations with bounding boxes
         if citations_dict:
-            citations_dict = pdf_service.enrich_citations_with_bounding_boxes(
+            citations_dict = await pdf_service.enrich_citations_with_bounding_boxes_async(
                 pdf_bytes,
                 citations_dict
             )
 
-        for field_path, value in list(extractions_dict.items()):
+        # Validate every schema field in one pass
+        fields_to_validate = {}
+        for field_path, value in extractions_dict.items():
             if value is not None:
                 # Get field definition from schema
                 field_def = get_field_by_path(field_path)
-
                 if field_def:
-                    # Validate and normalize
-                    validation_result = validation_service.validate_and_normalize(
-                        field_path,
-                        value,
-                        field_def['type'].value,
-                        all_extractions=extractions_dict
-                    )
-
-                    # Update with normalized value
-                    extractions_dict[field_path] = validation_result.value
-
-                    # Adjust confidence if validation suggests issues
-                    if validation_result.confidence_adjustment != 0:
-                        current_confidence = confidence_dict.get(field_path, 0.5)
-                        adjusted_confidence = max(
-                            0.0,
-                            min(1.0, current_confidence + validation_result.confidence_adjustment)
-                        )
-                        confidence_dict[field_path] = adjusted_confidence
-
-                    # Store warnings
-                    if validation_result.warnings:
-                        validation_warnings[field_path] = validation_result.warnings
+                    fields_to_validate[field_path] = (value, field_def['type'].value)
+
+        validation_results = validation_service.validate_all(
+            fields_to_validate,
+            all_extractions=extractions_dict
+        )
+
+        for field_path, validation_result in validation_results.items():
+            # Update with normalized value
+            extractions_dict[field_path] = validation_result.value
+
+            # Adjust confidence if validation suggests issues
+            if validation_result.confidence_adjustment != 0:
+                current_confidence = confidence_dict.get(field_path, 0.5)
+                adjusted_confidence = max(
+                    0.0,
+                    min(1.0, current_confidence + validation_result.confidence_adjustment)
+                )
+                confidence_dict[field_path] = adjusted_confidence
+
+            # Store warnings
+            if validation_result.has_warnings:
+                validation_warnings[field_path] = validation_result.warnings
 
         # Add validation warnings and few-shot info to metadata
         if 'metadata' not in result:
@@ -11,7 +11,7 @@ from app.core.dependencies import get_optional_user, get_current_user
 from app.models.lease import Lease, LeaseStatus
 from app.models.user import User
 from app.schemas.pydantic_schemas import LeaseResponse
-from app.services.storage_service import storage_service
+from app.services.storage_service import get_storage_service
 from app.services.pdf_service import pdf_service
 
 router = APIRouter()
@@ -73,7 +73,7 @@ async def upload_lease(
 
     # Validate it's a valid PDF and get page count
     try:
-        pdf_info = pdf_service.extract_text_from_bytes(file_content)
+        pdf_info = await pdf_service.extract_text_from_bytes_async(file_content)
         page_count = pdf_info['page_count']
     except Exception as e:
         raise HTTPException(
@@ -85,7 +85,7 @@ async def upload_lease(
     try:
         # Reset file pointer
         await file.seek(0)
-        storage_result = storage_service.upload_pdf(file.file, file.filename)
+        storage_result = await get_storage_service().upload_pdf_async(file.file, file.filename)
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -237,7 +237,7 @@ async def delete_lease(
 
     # Delete from storage
     try:
-        storage_service.delete_pdf(lease.file_path)
+        await get_storage_service().delete_pdf_async(lease.file_path)
     except Exception:
         pass  # Continue even if S3 deletion fails
 
@@ -274,10 +274,11 @@ async def get_download_url(
         )
 
     try:
-        url = storage_service.get_presigned_url(lease.file_path)
+        # The URL may be a cached one, so report its actual remaining lifetime
+        url, expires_in = get_storage_service().get_presigned_url_with_expiry(lease.file_path)
         return {
             "url": url,
-            "expires_in": 3600,  # 1 hour
+            "expires_in": expires_in,
         }
     except Exception as e:
         raise HTTPException(
@@ -308,7 +309,6 @@ async def get_lease_pdf(
         HTTPException: If lease not found or file cannot be read
     """
     from fastapi.responses import StreamingResponse
-    from io import BytesIO
     
     lease = db.query(Lease).filter(Lease.id == lease_id).first()
     if not lease:
@@ -318,12 +318,11 @@ async def get_lease_pdf(
         )
     
     try:
-        # Download PDF bytes from storage
-        pdf_bytes = storage_service.download_pdf(lease.file_path)
+        # Stream PDF chunks from storage without buffering the whole file
+        pdf_stream = get_storage_service().download_pdf_stream(lease.file_path)
         
-        # Return as streaming response
         return StreamingResponse(
-            BytesIO(pdf_bytes),
+            pdf_stream,
             media_type="application/pdf",
             headers={
                 "Content-Disposition": f'inline; filename="{lease.original_filename}"'
@@ -32,6 +32,10 @@ class Settings(BaseSettings):
     AWS_SECRET_ACCESS_KEY: str
     AWS_REGION: str = "us-east-1"
     S3_BUCKET_NAME: str
+    S3_TRANSFER_CLIENT: str = "auto"  # auto | classic | crt (crt needs boto3[crt])
+
+    # Citation bounding-box disk cache
+    BBOX_CACHE_DIR: str | None = None  # Falls back to the system temp dir if not set
 
     # CORS
     CORS_ORIGINS: str = "http://localhost:3000"
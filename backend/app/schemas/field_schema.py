@@ -341,13 +341,16 @@ LEASE_FIELDS: List[Dict[str, Any]] = [
     },
 ]
 
+# Path -> field definition, for O(1) lookups (first definition wins)
+_FIELDS_BY_PATH: Dict[str, Dict[str, Any]] = {}
+for _field in LEASE_FIELDS:
+    _FIELDS_BY_PATH.setdefault(_field["path"], _field)
+del _field
+
 
 def get_field_by_path(path: str) -> Dict[str, Any]:
     """Get field definition by path."""
-    for field in LEASE_FIELDS:
-        if field["path"] == path:
-            return field
-    return None
+    return _FIELDS_BY_PATH.get(path)
 
 
 def get_fields_by_category(category: FieldCategory) -> List[Dict[str, Any]]:
@@ -1,6 +1,173 @@
 """PDF processing service using PyMuPDF."""
+import asyncio
+import hashlib
+import os
+import sqlite3
+import tempfile
 import fitz  # PyMuPDF
-from typing import Dict, List, Optional
+from bisect import bisect_right
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Dict, List, Optional, Tuple
+
+from diskcache import Cache
+
+from app.core.config import settings
+
+
+def _init_worker():
+    """Load PyMuPDF once in each PDF worker process."""
+    import fitz  # noqa: F401
+
+
+# PyMuPDF is not thread-safe, so CPU-heavy PDF work runs in worker
+# processes, keeping the event loop free while it runs. Built on first use
+# and replaced if a worker dies
+_pdf_pool: Optional[ProcessPoolExecutor] = None
+
+
+def get_pdf_pool() -> ProcessPoolExecutor:
+    """Return the shared PDF worker pool, creating it on first call."""
+    global _pdf_pool
+    if _pdf_pool is None:
+        _pdf_pool = ProcessPoolExecutor(max_workers=os.cpu_count(), initializer=_init_worker)
+    return _pdf_pool
+
+
+def _discard_pdf_pool(pool: ProcessPoolExecutor) -> None:
+    """Drop a broken pool so the next get_pdf_pool() call builds a new one."""
+    global _pdf_pool
+    if _pdf_pool is pool:
+        _pdf_pool = None
+    pool.shutdown(wait=False)
+
+
+async def _run_in_pdf_pool(func, *args):
+    """
+    Run func(*args) in the PDF worker pool.
+
+    A worker that dies (e.g. MuPDF crashing on a malformed PDF) breaks the
+    whole pool permanently, and every call in flight sees BrokenProcessPool,
+    not just the one that crashed it. The pool is discarded (the next call
+    builds a new one) and the call is retried once in a throwaway
+    single-worker process: innocent calls succeed there, while input that
+    crashes MuPDF again only takes down that process and raises
+    BrokenProcessPool.
+    """
+    loop = asyncio.get_running_loop()
+    pool = get_pdf_pool()
+    try:
+        return await loop.run_in_executor(pool, func, *args)
+    except BrokenProcessPool:
+        _discard_pdf_pool(pool)
+
+    isolated = ProcessPoolExecutor(max_workers=1, initializer=_init_worker)
+    try:
+        return await loop.run_in_executor(isolated, func, *args)
+    finally:
+        isolated.shutdown(wait=False)
+
+
+# Citation bounding boxes keyed by (pdf hash, page, quote), shared across
+# requests and worker processes so re-extracting a PDF skips the search.
+# Opened on first use in each process; lookups go without it if the
+# directory can't be used
+BBOX_CACHE_TTL_SECONDS = 7 * 24 * 3600
+BBOX_CACHE_ERRORS = (OSError, sqlite3.Error)
+_bbox_cache: Optional[Cache] = None
+_bbox_cache_failed = False
+_CACHE_MISS = object()
+
+
+def get_bbox_cache_dir() -> str:
+    """Return the configured bounding-box cache directory."""
+    return settings.BBOX_CACHE_DIR or os.path.join(tempfile.gettempdir(), 'leasebee_bbox_cache')
+
+
+def get_bbox_cache() -> Optional[Cache]:
+    """Return the bounding-box disk cache, or None if it can't be opened."""
+    global _bbox_cache, _bbox_cache_failed
+    if _bbox_cache is None and not _bbox_cache_failed:
+        cache_dir = get_bbox_cache_dir()
+        try:
+            _bbox_cache = Cache(cache_dir, size_limit=1 << 30)
+        except BBOX_CACHE_ERRORS as e:
+            print(f"Warning: bounding box cache disabled, cannot open {cache_dir}: {str(e)}")
+            _bbox_cache_failed = True
+    return _bbox_cache
+
+
+def _build_word_index(page: "fitz.Page") -> Tuple[str, List[int], List[tuple]]:
+    """
+    Build a searchable index of a page's words.
+
+    Returns the page text as a single lowercased, space-joined string, the
+    start offset of each word in that string, and the PyMuPDF word tuples
+    (x0, y0, x1, y1, word, block_no, line_no, word_no).
+    """
+    words = page.get_text("words")
+    # Lowercase per word so offsets stay aligned when lowercasing changes
+    # a word's length
+    lowered = [word[4].lower() for word in words]
+    starts = []
+    offset = 0
+    for text in lowered:
+        starts.append(offset)
+        offset += len(text) + 1
+    return " ".join(lowered), starts, words
+
+
+def _find_in_word_index(
+    index: Tuple[str, List[int], List[tuple]],
+    text: str
+) -> Optional["fitz.Rect"]:
+    """
+    Locate text in a page word index.
+
+    Matching is case-insensitive and whitespace-normalized, like
+    page.search_for(). Returns the union of the matched words on the line
+    where the match starts, or None if the text is not found or the match
+    starts or ends mid-word (a word box would be wider than the text).
+    """
+    flat_text, starts, words = index
+    needle = " ".join(text.split()).lower()
+    if not needle:
+        return None
+
+    pos = flat_text.find(needle)
+    if pos < 0:
+        return None
+
+    end = pos + len(needle)
+    first = bisect_right(starts, pos) - 1
+    last = bisect_right(starts, end - 1) - 1
+    last_end = starts[last + 1] - 1 if last + 1 < len(starts) else len(flat_text)
+    if starts[first] != pos or end != last_end:
+        return None
+    line = words[first][5:7]
+
+    rect = fitz.Rect(words[first][:4])
+    for word in words[first + 1:last + 1]:
+        if word[5:7] != line:
+            break
+        rect |= fitz.Rect(word[:4])
+    return rect
+
+
+def _locate_text(
+    page: "fitz.Page",
+    index: Tuple[str, List[int], List[tuple]],
+    text: str
+) -> Optional["fitz.Rect"]:
+    """Find the first bounding box of text on a page, or None if absent."""
+    # The index only resolves whole-word matches; partial words (such as
+    # the quote[:20] fallback) and anything it misses go to search_for
+    bbox = _find_in_word_index(index, text)
+    if bbox is None:
+        text_instances = page.search_for(text)
+        bbox = text_instances[0] if text_instances else None
+    return bbox
 
 
 class PDFService:
@@ -171,48 +338,108 @@ class PDFService:
             return citations
 
         try:
-            pdf_document = fitz.open(stream=pdf_bytes, filetype="pdf")
-            enriched_citations = {}
+            # Citations are shared with the input until a bounding box is
+            # added; only those entries get a new dict
+            enriched_citations = dict(citations)
 
-            for field_path, citation in citations.items():
-                enriched_citation = citation.copy()
+            # Bucket citations by page so each page is loaded only once
+            citations_by_page = defaultdict(list)
 
+            for field_path, citation in citations.items():
                 if not citation or 'page' not in citation or 'quote' not in citation:
-                    enriched_citations[field_path] = enriched_citation
                     continue
 
                 page_num = citation['page']
-                quote = citation['quote']
 
-                # Validate page number
-                if page_num < 1 or page_num > pdf_document.page_count:
-                    enriched_citations[field_path] = enriched_citation
+                if page_num < 1:
                     continue
 
-                # Search for the quote on the specified page
-                page = pdf_document[page_num - 1]
-
-                # Try exact match first
-                text_instances = page.search_for(quote)
-
-                # If no exact match, try searching for first few words
-                if not text_instances and len(quote) > 20:
-                    # Try first 20 characters
-                    text_instances = page.search_for(quote[:20])
-
-                # Use the first match if found
-                if text_instances:
-                    bbox = text_instances[0]
-                    enriched_citation['bounding_box'] = {
-                        'x0': bbox.x0,
-                        'y0': bbox.y0,
-                        'x1': bbox.x1,
-                        'y1': bbox.y1,
-                    }
-
-                enriched_citations[field_path] = enriched_citation
-
-            pdf_document.close()
+                citations_by_page[page_num].append(field_path)
+
+            # Nothing to locate - don't parse the PDF at all
+            if not citations_by_page:
+                return enriched_citations
+
+            # Boxes found by earlier requests for the same PDF come from the
+            # disk cache; the PDF is only opened when something misses
+            pdf_hash = hashlib.blake2b(pdf_bytes, digest_size=16).digest()
+            disk_cache = get_bbox_cache()
+            pdf_document = None
+            indexed_pages = {}
+
+            # Boilerplate clauses are often cited by several fields, so
+            # memoize lookups by (page, text) within this call
+            bbox_cache: Dict[Tuple[int, str], Optional[Tuple[float, float, float, float]]] = {}
+
+            def search(page_num, text):
+                nonlocal pdf_document
+                key = (page_num, text)
+                if key in bbox_cache:
+                    return bbox_cache[key]
+
+                bbox = _CACHE_MISS
+                if disk_cache is not None:
+                    try:
+                        bbox = disk_cache.get((pdf_hash, page_num, text), default=_CACHE_MISS)
+                    except BBOX_CACHE_ERRORS:
+                        pass
+                if bbox is _CACHE_MISS:
+                    bbox = None
+                    if pdf_document is None:
+                        pdf_document = fitz.open(stream=pdf_bytes, filetype="pdf")
+
+                    # Validate page number
+                    if page_num <= pdf_document.page_count:
+                        if page_num not in indexed_pages:
+                            # Index the page text once and resolve quotes with a
+                            # plain substring scan; search_for is only used for
+                            # quotes the word index misses (e.g. ligatures)
+                            page = pdf_document[page_num - 1]
+                            indexed_pages[page_num] = (page, _build_word_index(page))
+                        rect = _locate_text(*indexed_pages[page_num], text)
+                        if rect is not None:
+                            bbox = (rect.x0, rect.y0, rect.x1, rect.y1)
+
+                    if disk_cache is not None:
+                        try:
+                            disk_cache.set(
+                                (pdf_hash, page_num, text), bbox, expire=BBOX_CACHE_TTL_SECONDS
+                            )
+                        except BBOX_CACHE_ERRORS:
+                            # A full or read-only cache only costs the reuse
+                            pass
+
+                bbox_cache[key] = bbox
+                return bbox
+
+            for page_num, field_paths in citations_by_page.items():
+                for field_path in field_paths:
+                    citation = citations[field_path]
+                    quote = citation['quote']
+
+                    # Try exact match first
+                    bbox = search(page_num, quote)
+
+                    # If no exact match, try searching for first few words
+                    if bbox is None and len(quote) > 20:
+                        # Try first 20 characters
+                        bbox = search(page_num, quote[:20])
+
+                    # Use the first match if found
+                    if bbox is not None:
+                        x0, y0, x1, y1 = bbox
+                        enriched_citations[field_path] = {
+                            **citation,
+                            'bounding_box': {
+                                'x0': x0,
+                                'y0': y0,
+                                'x1': x1,
+                                'y1': y1,
+                            },
+                        }
+
+            if pdf_document is not None:
+                pdf_document.close()
             return enriched_citations
 
         except Exception as e:
@@ -221,5 +448,32 @@ class PDFService:
             return citations
 
 
+    @staticmethod
+    async def extract_text_from_bytes_async(pdf_bytes: bytes) -> Dict:
+        """Run extract_text_from_bytes in the PDF worker pool."""
+        return await _run_in_pdf_pool(PDFService.extract_text_from_bytes, pdf_bytes)
+
+    @staticmethod
+    async def search_text_in_pdf_async(
+        pdf_bytes: bytes,
+        search_text: str,
+        page_number: Optional[int] = None
+    ) -> List[Dict]:
+        """Run search_text_in_pdf in the PDF worker pool."""
+        return await _run_in_pdf_pool(
+            PDFService.search_text_in_pdf, pdf_bytes, search_text, page_number
+        )
+
+    @staticmethod
+    async def enrich_citations_with_bounding_boxes_async(
+        pdf_bytes: bytes,
+        citations: Dict[str, Dict]
+    ) -> Dict[str, Dict]:
+        """Run enrich_citations_with_bounding_boxes in the PDF worker pool."""
+        return await _run_in_pdf_pool(
+            PDFService.enrich_citations_with_bounding_boxes, pdf_bytes, citations
+        )
+
+
 # Singleton instance
 pdf_service = PDFService()
@@ -1,10 +1,14 @@
 """Progress tracking for long-running extraction operations."""
 import time
 import asyncio
+import threading
+from dataclasses import dataclass, field
 from typing import Dict, Optional, Callable
 from datetime import datetime
 from enum import Enum
 
+from cachetools import TTLCache
+
 
 class ExtractionStage(str, Enum):
     """Stages of the extraction process."""
@@ -26,6 +30,11 @@ STAGE_WEIGHTS = {
     ExtractionStage.SAVING: 5,
 }
 
+TOTAL_STAGE_WEIGHT = sum(STAGE_WEIGHTS.values())
+
+# Polls closer together than this reuse the previous progress snapshot
+PROGRESS_CACHE_SECONDS = 0.25
+
 STAGE_DESCRIPTIONS = {
     ExtractionStage.UPLOADING: "Uploading PDF to storage",
     ExtractionStage.EXTRACTING_TEXT: "Reading PDF content",
@@ -50,63 +59,95 @@ EDUCATIONAL_TIPS = [
     "🔄 Your feedback on extractions helps improve accuracy for future documents.",
 ]
 
+_EDUCATIONAL_TIPS_LEN = len(EDUCATIONAL_TIPS)
+TIP_ROTATION_SECONDS = 8
+
 
+@dataclass(slots=True, eq=False)
 class ProgressTracker:
     """Tracks progress of extraction operations."""
-    
-    def __init__(self, operation_id: str):
-        self.operation_id = operation_id
-        self.current_stage = ExtractionStage.UPLOADING
-        self.stage_start_time = time.time()
-        self.start_time = time.time()
-        self.completed_stages: set = set()
-        self.estimated_total_seconds = 60  # Initial estimate
-        self.current_tip_index = 0
-        self.last_tip_change = time.time()
-        self._callbacks: list[Callable] = []
-        
-    def _notify(self):
-        """Notify all registered callbacks of progress update."""
+
+    operation_id: str
+    current_stage: ExtractionStage = ExtractionStage.UPLOADING
+    stage_start_time: float = field(default_factory=time.monotonic)
+    start_time: float = field(default_factory=time.monotonic)
+    completed_stages: set = field(default_factory=set)
+    estimated_total_seconds: float = 60  # Initial estimate
+    # Running total of STAGE_WEIGHTS for completed_stages
+    _completed_weight: int = field(default=0, init=False)
+    # Last get_progress() result, reused for polls within PROGRESS_CACHE_SECONDS
+    _last_progress: Optional[dict] = field(default=None, init=False, repr=False)
+    _last_progress_time: float = field(default=0.0, init=False, repr=False)
+    _last_progress_stage: Optional[ExtractionStage] = field(default=None, init=False, repr=False)
+    _callbacks: list[Callable] = field(default_factory=list, init=False, repr=False)
+    # Last progress dict sent to callbacks, used to compute deltas
+    _last_emitted: Optional[dict] = field(default=None, init=False, repr=False)
+
+    def _notify(self, full: bool = False):
+        """
+        Notify all registered callbacks of progress update.
+
+        The first notification (or any with full=True) carries the complete
+        progress dict; later ones only carry keys whose values changed, plus
+        operation_id.
+        """
         progress_data = self.get_progress()
+        if full or self._last_emitted is None:
+            payload = progress_data
+        else:
+            payload = {
+                key: value
+                for key, value in progress_data.items()
+                if self._last_emitted.get(key) != value
+            }
+            payload["operation_id"] = self.operation_id
+        self._last_emitted = progress_data
+
         for callback in self._callbacks:
             try:
-                callback(progress_data)
+                callback(payload)
             except Exception:
                 pass
                 
     def on_progress(self, callback: Callable):
-        """Register a callback for progress updates."""
+        """
+        Register a callback for progress updates.
+
+        Callbacks receive progress deltas (see _notify); merge them into the
+        previously received dict to reconstruct the full state.
+        """
         self._callbacks.append(callback)
         
     def advance_stage(self, stage: ExtractionStage):
         """Move to the next stage."""
         if self.current_stage != stage:
-            self.completed_stages.add(self.current_stage)
+            if self.current_stage not in self.completed_stages:
+                self._completed_weight += STAGE_WEIGHTS.get(self.current_stage, 0)
+                self.completed_stages.add(self.current_stage)
             self.current_stage = stage
-            self.stage_start_time = time.time()
+            self.stage_start_time = time.monotonic()
             self._update_estimate()
             self._notify()
             
     def _update_estimate(self):
         """Update time estimate based on actual performance."""
-        elapsed = time.time() - self.start_time
+        elapsed = time.monotonic() - self.start_time
         
-        # Calculate completed weight
-        completed_weight = sum(STAGE_WEIGHTS.get(s, 0) for s in self.completed_stages)
         current_stage_progress = self._get_current_stage_progress()
         current_stage_weight = STAGE_WEIGHTS.get(self.current_stage, 0) * current_stage_progress
         
-        total_weight = sum(STAGE_WEIGHTS.values())
-        progress_weight = completed_weight + current_stage_weight
+        progress_weight = self._completed_weight + current_stage_weight
         
         if progress_weight > 0:
             # Estimate: if X% of work took Y seconds, total will be Y/X%
-            estimated_total = (elapsed / progress_weight) * total_weight
+            estimated_total = (elapsed / progress_weight) * TOTAL_STAGE_WEIGHT
             self.estimated_total_seconds = max(estimated_total, elapsed + 5)  # At least 5s remaining
             
-    def _get_current_stage_progress(self) -> float:
+    def _get_current_stage_progress(self, now: Optional[float] = None) -> float:
         """Get progress within current stage (0-1)."""
-        stage_elapsed = time.time() - self.stage_start_time
+        if now is None:
+            now = time.monotonic()
+        stage_elapsed = now - self.stage_start_time
         
         # Stage-specific progress estimates
         if self.current_stage == ExtractionStage.ANALYZING:
@@ -119,52 +160,71 @@ class ProgressTracker:
             
     def get_progress(self) -> dict:
         """Get current progress information."""
-        elapsed = time.time() - self.start_time
+        now = time.monotonic()
+        elapsed = now - self.start_time
+
+        # Rapid polls within the same stage only need fresh timings
+        if (
+            self._last_progress is not None
+            and self._last_progress_stage == self.current_stage
+            and now - self._last_progress_time < PROGRESS_CACHE_SECONDS
+        ):
+            progress = dict(self._last_progress)
+            progress["elapsed_seconds"] = int(elapsed)
+            progress["estimated_remaining_seconds"] = int(max(0, self.estimated_total_seconds - elapsed))
+            return progress
         
         # Calculate overall percentage
-        completed_weight = sum(STAGE_WEIGHTS.get(s, 0) for s in self.completed_stages)
-        current_stage_progress = self._get_current_stage_progress()
+        current_stage_progress = self._get_current_stage_progress(now)
         current_stage_weight = STAGE_WEIGHTS.get(self.current_stage, 0) * current_stage_progress
         
-        total_weight = sum(STAGE_WEIGHTS.values())
-        percentage = int(((completed_weight + current_stage_weight) / total_weight) * 100)
+        percentage = int(((self._completed_weight + current_stage_weight) / TOTAL_STAGE_WEIGHT) * 100)
         
         # Time estimates
         remaining = max(0, self.estimated_total_seconds - elapsed)
         
-        # Rotate tip every 8 seconds
-        if time.time() - self.last_tip_change > 8:
-            self.current_tip_index = (self.current_tip_index + 1) % len(EDUCATIONAL_TIPS)
-            self.last_tip_change = time.time()
-            
-        return {
+        # Rotate tip every 8 seconds, derived from elapsed time so reads
+        # don't mutate the tracker
+        tip_index = int(elapsed // TIP_ROTATION_SECONDS) % _EDUCATIONAL_TIPS_LEN
+
+        progress = {
             "operation_id": self.operation_id,
             "stage": self.current_stage.value,
             "stage_description": STAGE_DESCRIPTIONS[self.current_stage],
             "percentage": percentage,  # Allow 100%
             "elapsed_seconds": int(elapsed),
             "estimated_remaining_seconds": int(remaining),
-            "tip": EDUCATIONAL_TIPS[self.current_tip_index],
+            "tip": EDUCATIONAL_TIPS[tip_index],
             "completed_stages": [s.value for s in self.completed_stages],
         }
 
+        self._last_progress = progress
+        self._last_progress_time = now
+        self._last_progress_stage = self.current_stage
+        return dict(progress)
+
 
-# Global progress store
-_progress_trackers: Dict[str, ProgressTracker] = {}
+# Global progress store. Trackers expire after an hour so extractions that
+# crash before remove_tracker() is called don't leak.
+_progress_trackers: TTLCache = TTLCache(maxsize=10_000, ttl=3600)
+_progress_trackers_lock = threading.RLock()
 
 
 def get_tracker(operation_id: str) -> Optional[ProgressTracker]:
     """Get a progress tracker by ID."""
-    return _progress_trackers.get(operation_id)
+    with _progress_trackers_lock:
+        return _progress_trackers.get(operation_id)
 
 
 def create_tracker(operation_id: str) -> ProgressTracker:
     """Create a new progress tracker."""
     tracker = ProgressTracker(operation_id)
-    _progress_trackers[operation_id] = tracker
+    with _progress_trackers_lock:
+        _progress_trackers[operation_id] = tracker
     return tracker
 
 
 def remove_tracker(operation_id: str):
     """Remove a progress tracker."""
-    _progress_trackers.pop(operation_id, None)
+    with _progress_trackers_lock:
+        _progress_trackers.pop(operation_id, None)
@@ -1,40 +1,625 @@
 """Storage service for handling PDF file uploads - supports S3 and local storage."""
+import asyncio
+import io
 import os
+import shutil
+import threading
+import time
 import uuid
-from typing import BinaryIO
+from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import BinaryIO, Iterable, Iterator, List, Optional, Tuple
 from pathlib import Path
+from types import MappingProxyType
+
+import boto3
+from boto3.exceptions import S3UploadFailedError
+from boto3.s3.transfer import TransferConfig
+from botocore.config import Config as BotoConfig
+from botocore.exceptions import BotoCoreError, ClientError
+from cachetools import LRUCache
 
 from app.core.config import settings
 
+# Storage key prefix for uploaded lease PDFs
+KEY_PREFIX = "leases/"
+
 # Determine storage backend
 USE_LOCAL_STORAGE = settings.ENVIRONMENT == 'development' and settings.AWS_ACCESS_KEY_ID == 'test'
 
-if USE_LOCAL_STORAGE:
-    # Local file storage for development — project-relative so files survive reboots
-    LOCAL_STORAGE_PATH = Path(__file__).resolve().parents[2] / 'uploads'
-    LOCAL_STORAGE_PATH.mkdir(parents=True, exist_ok=True)
-else:
-    # S3 storage for production
-    import boto3
-    from botocore.exceptions import ClientError
+# Local file storage for development — project-relative so files survive reboots
+LOCAL_STORAGE_PATH = Path(__file__).resolve().parents[2] / 'uploads'
+
+# Flags for writing local uploads (O_CLOEXEC/O_BINARY only exist on some platforms)
+LOCAL_UPLOAD_FLAGS = (
+    os.O_WRONLY | os.O_CREAT | os.O_TRUNC
+    | getattr(os, 'O_CLOEXEC', 0) | getattr(os, 'O_BINARY', 0)
+)
+
+MB = 1024 * 1024
+
+# Upload lease PDFs in parallel 5 MB parts instead of boto3's 8 MB default.
+# S3_TRANSFER_CLIENT=crt switches managed transfers to the AWS Common Runtime
+# client when awscrt is installed; the part settings only apply to classic.
+TRANSFER_CONFIG = TransferConfig(
+    multipart_threshold=5 * MB,
+    multipart_chunksize=5 * MB,
+    max_concurrency=16,
+    use_threads=True,
+    preferred_transfer_client=settings.S3_TRANSFER_CLIENT,
+)
+
+# Shared client settings: FastAPI handlers and the transfer manager's threads all
+# use one client, so the default pool of 10 connections starves under load
+CLIENT_CONFIG = BotoConfig(
+    max_pool_connections=50,
+    retries={'max_attempts': 5, 'mode': 'adaptive'},
+    tcp_keepalive=True,
+    s3={'addressing_style': 'virtual'},
+)
+
+# Blocking storage I/O from async routes runs here instead of on the event loop
+STORAGE_POOL = ThreadPoolExecutor(max_workers=32, thread_name_prefix='storage')
+
+# Batch operations: upload threads per call, and S3's DeleteObjects key limit
+BATCH_MAX_WORKERS = 16
+DELETE_BATCH_SIZE = 1000
+
+# Presigned URLs are reused for half their lifetime, and never with less
+# than PRESIGNED_URL_MIN_REMAINING seconds of validity left
+PRESIGNED_URL_CACHE_SIZE = 10_000
+PRESIGNED_URL_MIN_REMAINING = 60
+
+# Errors an S3 call can raise once botocore's own retries are exhausted
+S3_ERRORS = (ClientError, BotoCoreError, S3UploadFailedError)
+
+# Chunk size for streamed downloads
+STREAM_CHUNK_SIZE = 1 << 20
+
+# Downloads larger than this go through the managed transfer (parallel ranged GETs)
+PARALLEL_DOWNLOAD_THRESHOLD = 16 * MB
+
+
+def _generate_storage_key(original_filename: str) -> Tuple[str, str]:
+    """
+    Generate a unique filename and storage key for an upload.
+
+    Args:
+        original_filename: Original name of the file
+
+    Returns:
+        Tuple of (unique filename, storage key)
+    """
+    # Only the last path component can hold the extension; like splitext,
+    # leading dots (".bashrc") don't start one. The filename is
+    # client-supplied, so never carry a path separator into the key
+    name, dot, ext = original_filename.rpartition('/')[2].rpartition('.')
+    file_ext = dot + ext if name.strip('.') and '\\' not in ext else ''
+    unique_filename = uuid.uuid4().hex + file_ext
+    return unique_filename, KEY_PREFIX + unique_filename
+
+
+@lru_cache(maxsize=4)
+def _build_s3_client(aws_access_key_id: str, aws_secret_access_key: str, region_name: str):
+    """
+    Build one S3 client per credential set and region.
+
+    Clients are thread-safe, so every backend using the same credentials
+    shares one client and its connection pool instead of re-loading the
+    service model.
+    """
+    return boto3.client(
+        's3',
+        aws_access_key_id=aws_access_key_id,
+        aws_secret_access_key=aws_secret_access_key,
+        region_name=region_name,
+        config=CLIENT_CONFIG,
+    )
+
+
+def _presigned_url_reuse_threshold(expiration: int) -> float:
+    """Return the validity a cached presigned URL must still have to be reused."""
+    return max(expiration / 2, PRESIGNED_URL_MIN_REMAINING)
+
+
+def _sendfile(src: BinaryIO, out_fd: int) -> bool:
+    """
+    Copy a disk-backed upload into out_fd without passing through userspace.
+
+    Returns False, having written nothing, when the source has no usable file
+    descriptor (in-memory spool, BytesIO) or the platform lacks file-to-file
+    sendfile, so the caller can fall back to a buffered copy.
+    """
+    # fileno() on an in-memory SpooledTemporaryFile would force a rollover
+    if not getattr(src, '_rolled', True):
+        return False
+    try:
+        in_fd = src.fileno()
+        size = os.fstat(in_fd).st_size
+        sent = os.sendfile(out_fd, in_fd, 0, size)
+    except (AttributeError, OSError, io.UnsupportedOperation):
+        return False
+
+    offset = sent
+    while sent and offset < size:
+        sent = os.sendfile(out_fd, in_fd, offset, size - offset)
+        offset += sent
+    return True
+
+
+def _iter_file(f: BinaryIO, chunk_size: int) -> Iterator[bytes]:
+    """Yield chunks from an open file and close it when exhausted."""
+    with f:
+        while chunk := f.read(chunk_size):
+            yield chunk
+
+
+def _iter_body(body, chunk_size: int) -> Iterator[bytes]:
+    """
+    Yield chunks from an S3 StreamingBody and close it when done.
+
+    Closing also runs when the consumer stops early (e.g. a client
+    disconnects mid-download), returning the connection to the pool.
+    """
+    try:
+        yield from body.iter_chunks(chunk_size=chunk_size)
+    finally:
+        body.close()
+
+
+class StorageBackend(ABC):
+    """Interface implemented by the local and S3 storage backends."""
+
+    bucket_name: str
+
+    @abstractmethod
+    def upload_pdf(self, file: BinaryIO, original_filename: str) -> dict:
+        """Upload a PDF file and return its storage metadata."""
+
+    @abstractmethod
+    def download_pdf(self, file_path: str) -> bytes:
+        """Download a PDF file's content."""
+
+    @abstractmethod
+    def download_pdf_stream(self, file_path: str, chunk_size: int = STREAM_CHUNK_SIZE) -> Iterator[bytes]:
+        """Open a PDF file and return an iterator over its content in chunks."""
+
+    @abstractmethod
+    def delete_pdf(self, file_path: str) -> bool:
+        """Delete a PDF file."""
+
+    @abstractmethod
+    def get_presigned_url(self, file_path: str, expiration: int = 3600) -> str:
+        """Generate a temporary access URL for a PDF."""
+
+    def get_presigned_url_with_expiry(self, file_path: str, expiration: int = 3600) -> Tuple[str, int]:
+        """Return a temporary access URL and the seconds it remains valid."""
+        return self.get_presigned_url(file_path, expiration), expiration
+
+    def upload_many_pdfs(self, files: Iterable[Tuple[BinaryIO, str]]) -> List[dict]:
+        """
+        Upload several PDFs concurrently.
+
+        Args:
+            files: (file object, original filename) pairs
+
+        Returns:
+            Upload metadata for each file, in input order
+
+        Raises:
+            Exception: If any upload fails
+        """
+        with ThreadPoolExecutor(max_workers=BATCH_MAX_WORKERS) as executor:
+            return list(executor.map(lambda pair: self.upload_pdf(*pair), files))
+
+    def delete_many_pdfs(self, file_paths: Iterable[str]) -> bool:
+        """
+        Delete several PDFs.
+
+        Args:
+            file_paths: Storage keys/paths of the files
+
+        Returns:
+            True if successful
+
+        Raises:
+            Exception: If any deletion fails
+        """
+        for file_path in file_paths:
+            self.delete_pdf(file_path)
+        return True
+
+
+class LocalStorageBackend(StorageBackend):
+    """Stores PDFs on the local filesystem (development only)."""
+
+    def __init__(self, local_path: Path = LOCAL_STORAGE_PATH):
+        """
+        Initialize local storage.
+
+        Args:
+            local_path: Directory that uploaded files are stored under
+        """
+        self.local_path = local_path
+        # Uploads build plain str paths under this directory to avoid
+        # creating Path objects per request
+        self._leases_dir = os.path.join(str(local_path), KEY_PREFIX.rstrip('/'))
+        os.makedirs(self._leases_dir, exist_ok=True)
+        self.bucket_name = 'local-bucket'
+
+    def upload_pdf(self, file: BinaryIO, original_filename: str) -> dict:
+        """
+        Upload a PDF file to local storage.
+
+        Args:
+            file: File object to upload
+            original_filename: Original name of the file
+
+        Returns:
+            Dictionary with filename, file_path and original_filename
+
+        Raises:
+            Exception: If upload fails
+        """
+        unique_filename, s3_key = _generate_storage_key(original_filename)
+        local_file_path = os.path.join(self._leases_dir, unique_filename)
+
+        try:
+            file.seek(0)
+            fd = os.open(local_file_path, LOCAL_UPLOAD_FLAGS, 0o644)
+            with os.fdopen(fd, 'wb') as f:
+                # Spooled-to-disk uploads are copied in the kernel; otherwise
+                # stream in 1 MB chunks rather than reading the whole PDF
+                if not _sendfile(file, fd):
+                    shutil.copyfileobj(file, f, length=1 << 20)
+
+            return {
+                'filename': unique_filename,
+                'file_path': s3_key,
+                'original_filename': original_filename,
+            }
+        except OSError as e:
+            raise Exception(f"Failed to upload file locally: {str(e)}") from e
+
+    def download_pdf(self, file_path: str) -> bytes:
+        """
+        Download a PDF file from local storage.
+
+        Args:
+            file_path: Storage key/path of the file
+
+        Returns:
+            File content as bytes
+
+        Raises:
+            Exception: If download fails
+        """
+        local_file_path = self.local_path / file_path
+        try:
+            with open(local_file_path, 'rb') as f:
+                return f.read()
+        except OSError as e:
+            raise Exception(f"Failed to download file locally: {str(e)}") from e
+
+    def download_pdf_stream(self, file_path: str, chunk_size: int = STREAM_CHUNK_SIZE) -> Iterator[bytes]:
+        """
+        Stream a PDF file from local storage.
+
+        The file is opened eagerly so a missing file raises here rather than
+        partway through a response.
+
+        Args:
+            file_path: Storage key/path of the file
+            chunk_size: Maximum size of each yielded chunk
+
+        Returns:
+            Iterator over the file content
+
+        Raises:
+            Exception: If the file cannot be opened
+        """
+        local_file_path = self.local_path / file_path
+        try:
+            f = open(local_file_path, 'rb')
+        except OSError as e:
+            raise Exception(f"Failed to download file locally: {str(e)}") from e
+        return _iter_file(f, chunk_size)
+
+    def delete_pdf(self, file_path: str) -> bool:
+        """
+        Delete a PDF file from local storage.
+
+        Args:
+            file_path: Storage key/path of the file
+
+        Returns:
+            True if successful
+
+        Raises:
+            Exception: If deletion fails
+        """
+        local_file_path = self.local_path / file_path
+        try:
+            local_file_path.unlink(missing_ok=True)
+            return True
+        except OSError as e:
+            raise Exception(f"Failed to delete file locally: {str(e)}") from e
+
+    def get_presigned_url(self, file_path: str, expiration: int = 3600) -> str:
+        """
+        Return a file:// URL for a locally stored PDF.
+
+        Args:
+            file_path: Storage key/path of the file
+            expiration: Unused for local storage
+
+        Returns:
+            Local file URL string
+        """
+        local_file_path = self.local_path / file_path
+        return f"file://{local_file_path}"
+
+
+class S3StorageBackend(StorageBackend):
+    """Stores PDFs in an S3 bucket."""
+
+    # Upload arguments shared by every PDF; copied per call because s3transfer
+    # adds operation defaults to the dict it is given
+    _EXTRA_ARGS = MappingProxyType({
+        'ContentType': 'application/pdf',
+        'ServerSideEncryption': 'AES256',
+    })
+
+    def __init__(
+        self,
+        bucket_name: str,
+        aws_access_key_id: str,
+        aws_secret_access_key: str,
+        region_name: str,
+        transfer_config: Optional[TransferConfig] = None,
+    ):
+        """
+        Initialize the S3 client.
+
+        Args:
+            bucket_name: S3 bucket that stores lease PDFs
+            aws_access_key_id: AWS access key ID
+            aws_secret_access_key: AWS secret access key
+            region_name: AWS region of the bucket
+            transfer_config: Multipart settings for uploads and large downloads
+        """
+        self.s3_client = _build_s3_client(aws_access_key_id, aws_secret_access_key, region_name)
+        self.bucket_name = bucket_name
+        self.transfer_config = transfer_config or TRANSFER_CONFIG
+        # (file_path, expiration) -> (url, time.monotonic() when signed)
+        self._url_cache = LRUCache(maxsize=PRESIGNED_URL_CACHE_SIZE)
+        self._url_cache_lock = threading.Lock()
+
+    def upload_pdf(self, file: BinaryIO, original_filename: str) -> dict:
+        """
+        Upload a PDF file to S3.
+
+        Args:
+            file: File object to upload
+            original_filename: Original name of the file
+
+        Returns:
+            Dictionary with filename, file_path and original_filename
+
+        Raises:
+            Exception: If upload fails
+        """
+        unique_filename, s3_key = _generate_storage_key(original_filename)
+
+        try:
+            self.s3_client.upload_fileobj(
+                file,
+                self.bucket_name,
+                s3_key,
+                ExtraArgs=dict(self._EXTRA_ARGS),
+                Config=self.transfer_config,
+            )
+
+            return {
+                'filename': unique_filename,
+                'file_path': s3_key,
+                'original_filename': original_filename,
+            }
+        except S3_ERRORS as e:
+            raise Exception(f"Failed to upload file to S3: {str(e)}") from e
+
+    def download_pdf(self, file_path: str) -> bytes:
+        """
+        Download a PDF file from S3.
+
+        Args:
+            file_path: Storage key/path of the file
+
+        Returns:
+            File content as bytes
+
+        Raises:
+            Exception: If download fails
+        """
+        try:
+            response = self.s3_client.get_object(
+                Bucket=self.bucket_name,
+                Key=file_path
+            )
+            content_length = response.get('ContentLength', 0)
+            if content_length <= PARALLEL_DOWNLOAD_THRESHOLD:
+                return response['Body'].read()
+
+            # Large file: let the transfer manager fetch it as parallel
+            # ranged GETs instead of one serial stream
+            response['Body'].close()
+            buffer = io.BytesIO()
+            self.s3_client.download_fileobj(
+                self.bucket_name,
+                file_path,
+                buffer,
+                Config=self.transfer_config,
+            )
+            return buffer.getvalue()
+        except S3_ERRORS as e:
+            raise Exception(f"Failed to download file from S3: {str(e)}") from e
+
+    def download_pdf_stream(self, file_path: str, chunk_size: int = STREAM_CHUNK_SIZE) -> Iterator[bytes]:
+        """
+        Stream a PDF file from S3 without buffering the whole object.
+
+        The GET is issued eagerly so a missing key raises here rather than
+        partway through a response.
+
+        Args:
+            file_path: Storage key/path of the file
+            chunk_size: Maximum size of each yielded chunk
+
+        Returns:
+            Iterator over the object body
+
+        Raises:
+            Exception: If the object cannot be fetched
+        """
+        try:
+            response = self.s3_client.get_object(
+                Bucket=self.bucket_name,
+                Key=file_path
+            )
+        except S3_ERRORS as e:
+            raise Exception(f"Failed to download file from S3: {str(e)}") from e
+        return _iter_body(response['Body'], chunk_size)
+
+    def delete_pdf(self, file_path: str) -> bool:
+        """
+        Delete a PDF file from S3.
+
+        Args:
+            file_path: Storage key/path of the file
+
+        Returns:
+            True if successful
+
+        Raises:
+            Exception: If deletion fails
+        """
+        try:
+            self.s3_client.delete_object(
+                Bucket=self.bucket_name,
+                Key=file_path
+            )
+            return True
+        except S3_ERRORS as e:
+            raise Exception(f"Failed to delete file from S3: {str(e)}") from e
+
+    def delete_many_pdfs(self, file_paths: Iterable[str]) -> bool:
+        """
+        Delete several PDFs from S3 with DeleteObjects, 1000 keys per request.
+
+        Args:
+            file_paths: Storage keys/paths of the files
+
+        Returns:
+            True if successful
+
+        Raises:
+            Exception: If any deletion fails
+        """
+        keys = list(file_paths)
+        try:
+            for start in range(0, len(keys), DELETE_BATCH_SIZE):
+                response = self.s3_client.delete_objects(
+                    Bucket=self.bucket_name,
+                    Delete={
+                        'Objects': [{'Key': key} for key in keys[start:start + DELETE_BATCH_SIZE]],
+                        'Quiet': True,
+                    }
+                )
+                errors = response.get('Errors')
+                if errors:
+                    failed = ', '.join(error['Key'] for error in errors)
+                    raise Exception(f"Failed to delete files from S3: {failed}")
+            return True
+        except S3_ERRORS as e:
+            raise Exception(f"Failed to delete files from S3: {str(e)}") from e
+
+    def get_presigned_url(self, file_path: str, expiration: int = 3600) -> str:
+        """
+        Generate a presigned S3 URL for temporary access to a PDF.
+
+        Args:
+            file_path: Storage key/path of the file
+            expiration: URL expiration time in seconds
+
+        Returns:
+            Presigned URL string
+
+        Raises:
+            Exception: If URL generation fails
+        """
+        return self.get_presigned_url_with_expiry(file_path, expiration)[0]
+
+    def get_presigned_url_with_expiry(self, file_path: str, expiration: int = 3600) -> Tuple[str, int]:
+        """
+        Generate a presigned S3 URL and report how long it remains valid.
+
+        URLs are cached per (file_path, expiration) and reused while at least
+        half their lifetime (and at least PRESIGNED_URL_MIN_REMAINING
+        seconds) is left, so repeated requests skip SigV4 signing.
+
+        Args:
+            file_path: Storage key/path of the file
+            expiration: URL expiration time in seconds
+
+        Returns:
+            Tuple of (presigned URL, seconds until it expires)
+
+        Raises:
+            Exception: If URL generation fails
+        """
+        key = (file_path, expiration)
+        with self._url_cache_lock:
+            cached = self._url_cache.get(key)
+        if cached is not None:
+            url, signed_at = cached
+            remaining = expiration - (time.monotonic() - signed_at)
+            if remaining >= _presigned_url_reuse_threshold(expiration):
+                return url, int(remaining)
+
+        try:
+            signed_at = time.monotonic()
+            url = self.s3_client.generate_presigned_url(
+                'get_object',
+                Params={
+                    'Bucket': self.bucket_name,
+                    'Key': file_path
+                },
+                ExpiresIn=expiration
+            )
+            with self._url_cache_lock:
+                self._url_cache[key] = (url, signed_at)
+            return url, expiration
+        except S3_ERRORS as e:
+            raise Exception(f"Failed to generate presigned URL: {str(e)}") from e
 
 
 class StorageService:
     """Service for managing PDF file storage."""
 
-    def __init__(self):
-        """Initialize storage backend."""
-        if USE_LOCAL_STORAGE:
-            self.local_path = LOCAL_STORAGE_PATH
-            self.bucket_name = 'local-bucket'
-        else:
-            self.s3_client = boto3.client(
-                's3',
-                aws_access_key_id=settings.AWS_ACCESS_KEY_ID,
-                aws_secret_access_key=settings.AWS_SECRET_ACCESS_KEY,
-                region_name=settings.AWS_REGION,
-            )
-            self.bucket_name = settings.S3_BUCKET_NAME
+    def __init__(self, backend: StorageBackend):
+        """
+        Initialize storage service.
+
+        Args:
+            backend: Storage backend that files are read from and written to
+        """
+        self.backend = backend
+
+    @property
+    def bucket_name(self) -> str:
+        """Bucket name of the underlying backend."""
+        return self.backend.bucket_name
 
     def upload_pdf(self, file: BinaryIO, original_filename: str) -> dict:
         """
@@ -53,50 +638,7 @@ class StorageService:
         Raises:
             Exception: If upload fails
         """
-        # Generate unique filename
-        file_ext = os.path.splitext(original_filename)[1]
-        unique_filename = f"{uuid.uuid4()}{file_ext}"
-        
-        if USE_LOCAL_STORAGE:
-            # Local file storage
-            s3_key = f"leases/{unique_filename}"
-            local_file_path = self.local_path / s3_key
-            local_file_path.parent.mkdir(parents=True, exist_ok=True)
-            
-            try:
-                file.seek(0)
-                with open(local_file_path, 'wb') as f:
-                    f.write(file.read())
-                
-                return {
-                    'filename': unique_filename,
-                    'file_path': s3_key,
-                    'original_filename': original_filename,
-                }
-            except Exception as e:
-                raise Exception(f"Failed to upload file locally: {str(e)}")
-        else:
-            # S3 storage
-            s3_key = f"leases/{unique_filename}"
-            
-            try:
-                self.s3_client.upload_fileobj(
-                    file,
-                    self.bucket_name,
-                    s3_key,
-                    ExtraArgs={
-                        'ContentType': 'application/pdf',
-                        'ServerSideEncryption': 'AES256',
-                    }
-                )
-                
-                return {
-                    'filename': unique_filename,
-                    'file_path': s3_key,
-                    'original_filename': original_filename,
-                }
-            except Exception as e:
-                raise Exception(f"Failed to upload file to S3: {str(e)}")
+        return self.backend.upload_pdf(file, original_filename)
 
     def download_pdf(self, file_path: str) -> bytes:
         """
@@ -111,22 +653,23 @@ class StorageService:
         Raises:
             Exception: If download fails
         """
-        if USE_LOCAL_STORAGE:
-            local_file_path = self.local_path / file_path
-            try:
-                with open(local_file_path, 'rb') as f:
-                    return f.read()
-            except Exception as e:
-                raise Exception(f"Failed to download file locally: {str(e)}")
-        else:
-            try:
-                response = self.s3_client.get_object(
-                    Bucket=self.bucket_name,
-                    Key=file_path
-                )
-                return response['Body'].read()
-            except Exception as e:
-                raise Exception(f"Failed to download file from S3: {str(e)}")
+        return self.backend.download_pdf(file_path)
+
+    def download_pdf_stream(self, file_path: str, chunk_size: int = STREAM_CHUNK_SIZE) -> Iterator[bytes]:
+        """
+        Stream a PDF file from storage in chunks.
+
+        Args:
+            file_path: Storage key/path of the file
+            chunk_size: Maximum size of each yielded chunk
+
+        Returns:
+            Iterator over the file content
+
+        Raises:
+            Exception: If the file cannot be opened
+        """
+        return self.backend.download_pdf_stream(file_path, chunk_size)
 
     def delete_pdf(self, file_path: str) -> bool:
         """
@@ -141,23 +684,7 @@ class StorageService:
         Raises:
             Exception: If deletion fails
         """
-        if USE_LOCAL_STORAGE:
-            local_file_path = self.local_path / file_path
-            try:
-                if local_file_path.exists():
-                    local_file_path.unlink()
-                return True
-            except Exception as e:
-                raise Exception(f"Failed to delete file locally: {str(e)}")
-        else:
-            try:
-                self.s3_client.delete_object(
-                    Bucket=self.bucket_name,
-                    Key=file_path
-                )
-                return True
-            except Exception as e:
-                raise Exception(f"Failed to delete file from S3: {str(e)}")
+        return self.backend.delete_pdf(file_path)
 
     def get_presigned_url(self, file_path: str, expiration: int = 3600) -> str:
         """
@@ -173,24 +700,95 @@ class StorageService:
         Raises:
             Exception: If URL generation fails
         """
-        if USE_LOCAL_STORAGE:
-            # For local storage, return a local file URL
-            local_file_path = self.local_path / file_path
-            return f"file://{local_file_path}"
-        else:
-            try:
-                url = self.s3_client.generate_presigned_url(
-                    'get_object',
-                    Params={
-                        'Bucket': self.bucket_name,
-                        'Key': file_path
-                    },
-                    ExpiresIn=expiration
-                )
-                return url
-            except Exception as e:
-                raise Exception(f"Failed to generate presigned URL: {str(e)}")
+        return self.backend.get_presigned_url(file_path, expiration)
+
+    def get_presigned_url_with_expiry(self, file_path: str, expiration: int = 3600) -> Tuple[str, int]:
+        """
+        Generate a presigned URL and report how long it remains valid.
+
+        Args:
+            file_path: Storage key/path of the file
+            expiration: URL expiration time in seconds (default: 1 hour)
+
+        Returns:
+            Tuple of (presigned URL, seconds until it expires)
+
+        Raises:
+            Exception: If URL generation fails
+        """
+        return self.backend.get_presigned_url_with_expiry(file_path, expiration)
+
+    def upload_many_pdfs(self, files: Iterable[Tuple[BinaryIO, str]]) -> List[dict]:
+        """
+        Upload several PDFs concurrently.
+
+        Args:
+            files: (file object, original filename) pairs
+
+        Returns:
+            Upload metadata for each file, in input order
+
+        Raises:
+            Exception: If any upload fails
+        """
+        return self.backend.upload_many_pdfs(files)
+
+    def delete_many_pdfs(self, file_paths: Iterable[str]) -> bool:
+        """
+        Delete several PDFs from storage.
+
+        Args:
+            file_paths: Storage keys/paths of the files
+
+        Returns:
+            True if successful
+
+        Raises:
+            Exception: If any deletion fails
+        """
+        return self.backend.delete_many_pdfs(file_paths)
+
+    async def upload_pdf_async(self, file: BinaryIO, original_filename: str) -> dict:
+        """Run upload_pdf in the storage thread pool."""
+        return await asyncio.get_running_loop().run_in_executor(
+            STORAGE_POOL, self.upload_pdf, file, original_filename
+        )
+
+    async def download_pdf_async(self, file_path: str) -> bytes:
+        """Run download_pdf in the storage thread pool."""
+        return await asyncio.get_running_loop().run_in_executor(
+            STORAGE_POOL, self.download_pdf, file_path
+        )
+
+    async def delete_pdf_async(self, file_path: str) -> bool:
+        """Run delete_pdf in the storage thread pool."""
+        return await asyncio.get_running_loop().run_in_executor(
+            STORAGE_POOL, self.delete_pdf, file_path
+        )
+
+
+def create_storage_service() -> StorageService:
+    """Create a storage service using the backend configured for this environment."""
+    if USE_LOCAL_STORAGE:
+        backend: StorageBackend = LocalStorageBackend()
+    else:
+        backend = S3StorageBackend(
+            bucket_name=settings.S3_BUCKET_NAME,
+            aws_access_key_id=settings.AWS_ACCESS_KEY_ID,
+            aws_secret_access_key=settings.AWS_SECRET_ACCESS_KEY,
+            region_name=settings.AWS_REGION,
+        )
+    return StorageService(backend)
+
+
+# Singleton instance, built on first use so importing this module does not
+# construct a boto3 client
+storage_service: Optional[StorageService] = None
 
 
-# Singleton instance
-storage_service = StorageService()
+def get_storage_service() -> StorageService:
+    """Return the shared storage service, creating it on first call."""
+    global storage_service
+    if storage_service is None:
+        storage_service = create_storage_service()
+    return storage_service
@@ -7,15 +7,175 @@ This service validates and normalizes extracted values, checking for:
 - Cross-field consistency
 - Type conformance
 """
-from typing import Any, Dict, List, Optional
-from datetime import datetime
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, List, Optional, Tuple
+from datetime import date, datetime
+from functools import lru_cache
+import calendar
+import math
+import os
 import re
 from decimal import Decimal, InvalidOperation
 
+# Patterns used on every validated field, compiled once at import
+_ISO_DATE_RE = re.compile(r'^\d{4}-\d{2}-\d{2}$')
+# Area unit suffixes and thousands separators, removed in a single pass
+_AREA_CLEAN_RE = re.compile(r'(?i)\s*(?:sf|square\s+feet|sq\.?\s*ft\.?|rsf|usf)|,')
+_SUITE_RE = re.compile(r'(?i)(suite|ste\.?|unit|#)\s*[\w\d-]+')
+# Address components in one pass; ZIP comes first so a ZIP is not consumed
+# as a plain street number (a ZIP also counts as a number)
+_ADDR_COMPONENTS_RE = re.compile(
+    r'(?P<zip>\b\d{5}(?:-\d{4})?\b)|(?P<num>\b\d+\b)|(?P<state>\b[A-Z]{2}\b)'
+)
+
+# Currency symbols and thousands separators stripped before parsing
+_CURRENCY_STRIP = str.maketrans('', '', '$,€£¥')
+
+# Accepted boolean spellings; strings are compared stripped and lowercased
+_TRUE_VALUES = frozenset({'true', 't', 'yes', 'y', '1', 1})
+_FALSE_VALUES = frozenset({'false', 'f', 'no', 'n', '0', 0})
+
+# Common non-ISO date shapes, matched in one pass before the strptime loop
+_DATE_DISPATCH_RE = re.compile(
+    r'^(?:(?P<a>\d{1,2})/(?P<b>\d{1,2})/(?P<y>\d{4}|\d{2})'
+    r'|(?P<mname>[A-Za-z]+)\s+(?P<d_name>\d{1,2}),\s+(?P<y_name>\d{4})'
+    r'|(?P<y_slash>\d{4})/(?P<m_slash>\d{1,2})/(?P<d_slash>\d{1,2})'
+    r'|(?P<m_dash>\d{1,2})-(?P<d_dash>\d{1,2})-(?P<y_dash>\d{4})'
+    r'|(?P<y_compact>\d{4})(?P<m_compact>\d{2})(?P<d_compact>\d{2}))$'
+)
+
+# strptime fallback formats, each paired with a loose shape check so
+# strptime only runs (and raises) when the input could plausibly match
+_DATE_FORMATS = (
+    ('%m/%d/%Y', re.compile(r'^\d{1,2}/ ?\d{1,2}/\d{4}$')),   # US format: 01/15/2024
+    ('%m/%d/%y', re.compile(r'^\d{1,2}/ ?\d{1,2}/\d{2}$')),   # US format: 1/15/24
+    ('%d/%m/%Y', re.compile(r'^ ?\d{1,2}/\d{1,2}/\d{4}$')),   # International: 15/01/2024
+    ('%d/%m/%y', re.compile(r'^ ?\d{1,2}/\d{1,2}/\d{2}$')),
+    ('%B %d, %Y', re.compile(r'^[^\W\d_]+\s+ ?\d{1,2},\s+\d{4}$')),  # January 15, 2024
+    ('%b %d, %Y', re.compile(r'^[^\W\d_]+\s+ ?\d{1,2},\s+\d{4}$')),  # Jan 15, 2024
+    ('%Y/%m/%d', re.compile(r'^\d{4}/\d{1,2}/ ?\d{1,2}$')),   # ISO with slashes: 2024/01/15
+    ('%m-%d-%Y', re.compile(r'^\d{1,2}- ?\d{1,2}-\d{4}$')),   # US with dashes: 01-15-2024
+    ('%Y%m%d', re.compile(r'^\d{4}\d{1,2} ?\d{1,2}$')),       # Compact: 20240115
+)
+_MONTHS = {
+    **{name.lower(): i for i, name in enumerate(calendar.month_abbr) if name},
+    **{name.lower(): i for i, name in enumerate(calendar.month_name) if name},
+}
+
+
+# Field-path keywords that change how a value is validated
+_PATH_KEYWORDS = ('month', 'rentable', 'usable', 'suite', 'name')
+
+
+@lru_cache(maxsize=1024)
+def _path_keywords(field_path: str) -> frozenset:
+    """
+    Return the _PATH_KEYWORDS contained in a field path (case-insensitive).
+
+    Field paths come from a fixed schema, so each is lowercased and scanned
+    once instead of on every validation.
+    """
+    field_path_lower = field_path.lower()
+    return frozenset(k for k in _PATH_KEYWORDS if k in field_path_lower)
+
+
+def _as_str(value: Any) -> str:
+    """Return value as a str, skipping the conversion for exact strings."""
+    return value if type(value) is str else str(value)
+
+
+def _is_plain_number(value: Any) -> bool:
+    """
+    Return True for ints/floats that float() converts exactly as float(str()) would.
+
+    Such values skip string clean-up. Bools are excluded because str(True) is
+    not a number, and ints beyond float range because float() raises on them.
+    """
+    if type(value) is float:
+        return True
+    return type(value) is int and -10**308 < value < 10**308
+
+
+def _is_cent_precision_number(value: Any) -> bool:
+    """
+    Return True for finite ints/floats that are already rounded to cents.
+
+    For these, float(round(Decimal(str(value)), 2)) == float(value), so
+    currency validation can skip the Decimal conversion. Magnitudes are
+    capped well inside float's exact-integer range and Decimal's precision.
+    """
+    if type(value) is int:
+        return -10**15 < value < 10**15
+    if type(value) is float:
+        return math.isfinite(value) and abs(value) < 1e15 and round(value, 2) == value
+    return False
+
+
+@lru_cache(maxsize=1024)
+def _parse_iso(value: str) -> date:
+    """
+    Parse a YYYY-MM-DD string, memoized across fields of the same lease.
+
+    Uses strptime rather than date.fromisoformat: consistency checks pass
+    raw extraction values here, and fromisoformat accepts other shapes
+    ('20240115', '2024-W03-1') while rejecting unpadded '2024-1-5'.
+
+    Raises:
+        ValueError: If the string is not a valid ISO date
+    """
+    return datetime.strptime(value, '%Y-%m-%d').date()
+
+
+def _parse_date_fast(value_str: str) -> Optional[date]:
+    """
+    Parse the date shapes accepted by validate_date without strptime.
+
+    Mirrors the strptime format order: for d/d/yyyy, month-first is tried
+    before day-first. Returns None when the shape is not recognised or the
+    date is invalid, so the caller can fall back to the strptime loop.
+    """
+    match = _DATE_DISPATCH_RE.match(value_str)
+    if not match:
+        return None
+    g = match.groupdict()
+    try:
+        if g['a'] is not None:
+            year = int(g['y'])
+            if len(g['y']) == 2:
+                year += 2000 if year <= 68 else 1900
+            a, b = int(g['a']), int(g['b'])
+            try:
+                return date(year, a, b)
+            except ValueError:
+                return date(year, b, a)
+        if g['mname'] is not None:
+            month = _MONTHS.get(g['mname'].lower())
+            if month is None:
+                return None
+            return date(int(g['y_name']), month, int(g['d_name']))
+        if g['y_slash'] is not None:
+            return date(int(g['y_slash']), int(g['m_slash']), int(g['d_slash']))
+        if g['m_dash'] is not None:
+            return date(int(g['y_dash']), int(g['m_dash']), int(g['d_dash']))
+        return date(int(g['y_compact']), int(g['m_compact']), int(g['d_compact']))
+    except ValueError:
+        return None
+
+
+def _add_warning(warnings: Optional[List[str]], message: str) -> List[str]:
+    """Append a warning, creating the list on first use."""
+    if warnings is None:
+        return [message]
+    warnings.append(message)
+    return warnings
+
 
 class ValidationResult:
     """Result of validation with normalized value and warnings."""
 
+    __slots__ = ('value', '_warnings', 'confidence_adjustment')
+
     def __init__(
         self,
         value: Any,
@@ -31,13 +191,66 @@ class ValidationResult:
             confidence_adjustment: Adjustment to confidence score (+/- 0.2 max)
         """
         self.value = value
-        self.warnings = warnings or []
+        # Most fields validate cleanly, so the list is only created once a
+        # warning is added or the warnings are read
+        self._warnings = warnings or None
         self.confidence_adjustment = max(-0.2, min(0.2, confidence_adjustment))
 
+    @property
+    def warnings(self) -> List[str]:
+        """List of validation warnings."""
+        if self._warnings is None:
+            self._warnings = []
+        return self._warnings
+
+    @warnings.setter
+    def warnings(self, warnings: List[str]) -> None:
+        self._warnings = warnings
+
+    @property
+    def has_warnings(self) -> bool:
+        """Whether any warnings were recorded, without creating the list."""
+        return bool(self._warnings)
+
+    def add_warnings(self, warnings: List[str]) -> None:
+        """Append warnings, creating the list on first use."""
+        if not warnings:
+            return
+        if self._warnings is None:
+            self._warnings = list(warnings)
+        else:
+            self._warnings.extend(warnings)
+
 
 class ValidationService:
     """Validates and normalizes extracted field values."""
 
+    def __init__(self):
+        """Bind the per-type validators once."""
+        self._validators = {
+            'date': self.validate_date,
+            'currency': self.validate_currency,
+            'number': self.validate_number,
+            'percentage': self.validate_percentage,
+            'area': self.validate_area,
+            'boolean': self.validate_boolean,
+            'address': self.validate_address,
+            'text': self.validate_text,
+        }
+
+    def _get_validator(self, field_type: str):
+        """
+        Return the validator for a field type, defaulting to text.
+
+        Schema types are already lowercase, so the type is only lowercased
+        on a miss. The pre-bound dict lookup is faster than an if/elif or
+        match chain, which would create a bound method on every call.
+        """
+        return (
+            self._validators.get(field_type)
+            or self._validators.get(field_type.lower(), self.validate_text)
+        )
+
     def validate_and_normalize(
         self,
         field_path: str,
@@ -61,20 +274,7 @@ class ValidationService:
             return ValidationResult(None)
 
         # Route to appropriate validator based on field type
-        validators = {
-            'date': self.validate_date,
-            'currency': self.validate_currency,
-            'number': self.validate_number,
-            'percentage': self.validate_percentage,
-            'area': self.validate_area,
-            'boolean': self.validate_boolean,
-            'address': self.validate_address,
-            'text': self.validate_text,
-        }
-
-        # Normalize field type to lowercase
-        field_type_lower = field_type.lower()
-        validator = validators.get(field_type_lower, self.validate_text)
+        validator = self._get_validator(field_type)
 
         # Perform field-specific validation
         result = validator(value, field_path)
@@ -86,7 +286,7 @@ class ValidationService:
                 result.value,
                 all_extractions
             )
-            result.warnings.extend(consistency_warnings)
+            result.add_warnings(consistency_warnings)
 
             # Adjust confidence if consistency issues found
             if consistency_warnings:
@@ -94,6 +294,80 @@ class ValidationService:
 
         return result
 
+    def validate_all(
+        self,
+        fields: Dict[str, Tuple[Any, str]],
+        all_extractions: Optional[Dict] = None
+    ) -> Dict[str, ValidationResult]:
+        """
+        Validate and normalize all fields of a lease in one pass.
+
+        Fields are grouped by type so each validator runs over its fields
+        together, then cross-field consistency is checked once against the
+        fully normalized values.
+
+        Args:
+            fields: Field path -> (value, field type) for fields to validate
+            all_extractions: All extracted values, for consistency checks
+                against fields that are not being validated
+
+        Returns:
+            Field path -> ValidationResult, in the order of ``fields``
+        """
+        results: Dict[str, Optional[ValidationResult]] = dict.fromkeys(fields)
+
+        by_type: Dict[str, List[Tuple[str, Any]]] = defaultdict(list)
+        for field_path, (value, field_type) in fields.items():
+            if value is None:
+                results[field_path] = ValidationResult(None)
+            else:
+                by_type[field_type].append((field_path, value))
+
+        for field_type, items in by_type.items():
+            validator = self._get_validator(field_type)
+            for field_path, value in items:
+                results[field_path] = validator(value, field_path)
+
+        # Cross-field consistency against the fully normalized values
+        normalized = dict(all_extractions or {})
+        normalized.update((path, result.value) for path, result in results.items())
+        for field_path, result in results.items():
+            if result.value is None:
+                continue
+            consistency_warnings = self.check_consistency(field_path, result.value, normalized)
+            if consistency_warnings:
+                result.add_warnings(consistency_warnings)
+                result.confidence_adjustment -= 0.1
+
+        return results
+
+    def validate_leases_parallel(
+        self,
+        leases: List[Dict[str, Tuple[Any, str]]],
+        workers: Optional[int] = None
+    ) -> List[Dict[str, ValidationResult]]:
+        """
+        Validate many leases across worker processes.
+
+        Intended for bulk reprocessing jobs. Each worker imports this module
+        once and validates its share of leases with ``validate_all``.
+
+        Args:
+            leases: One ``validate_all`` fields mapping per lease
+            workers: Number of worker processes (defaults to the CPU count)
+
+        Returns:
+            ValidationResult mappings, in the order of ``leases``
+        """
+        workers = workers or os.cpu_count() or 1
+        if workers == 1 or len(leases) < 2:
+            return [self.validate_all(fields) for fields in leases]
+
+        workers = min(workers, len(leases))
+        chunksize = -(-len(leases) // workers)
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(_validate_lease, leases, chunksize=chunksize))
+
     def validate_date(self, value: str, field_path: str) -> ValidationResult:
         """
         Validate and normalize date to ISO format (YYYY-MM-DD).
@@ -105,42 +379,41 @@ class ValidationService:
         Returns:
             ValidationResult with normalized date
         """
-        warnings = []
+        warnings = None
 
         # Convert to string if not already
-        value_str = str(value).strip()
+        value_str = _as_str(value).strip()
 
         # Already in ISO format?
-        if re.match(r'^\d{4}-\d{2}-\d{2}$', value_str):
+        if _ISO_DATE_RE.match(value_str):
             try:
-                datetime.strptime(value_str, '%Y-%m-%d')
+                _parse_iso(value_str)
                 return ValidationResult(value_str, warnings)
             except ValueError:
-                warnings.append(f"Invalid date format: {value_str}")
+                warnings = _add_warning(warnings, f"Invalid date format: {value_str}")
                 return ValidationResult(None, warnings, -0.2)
 
-        # Try to parse various formats
-        formats = [
-            '%m/%d/%Y', '%m/%d/%y',  # US format: 01/15/2024, 1/15/24
-            '%d/%m/%Y', '%d/%m/%y',  # International: 15/01/2024
-            '%B %d, %Y',              # January 15, 2024
-            '%b %d, %Y',              # Jan 15, 2024
-            '%Y/%m/%d',               # ISO with slashes: 2024/01/15
-            '%m-%d-%Y',               # US with dashes: 01-15-2024
-            '%Y%m%d',                 # Compact: 20240115
-        ]
-
-        for fmt in formats:
+        # Common shapes are parsed directly; strptime is the fallback
+        parsed = _parse_date_fast(value_str)
+        if parsed is not None:
+            normalized = parsed.strftime('%Y-%m-%d')
+            warnings = _add_warning(warnings, f"Date format normalized from '{value_str}' to '{normalized}'")
+            return ValidationResult(normalized, warnings, 0.0)
+
+        # Try to parse various formats, skipping any whose shape can't match
+        for fmt, shape in _DATE_FORMATS:
+            if not shape.match(value_str):
+                continue
             try:
                 dt = datetime.strptime(value_str, fmt)
                 normalized = dt.strftime('%Y-%m-%d')
-                warnings.append(f"Date format normalized from '{value_str}' to '{normalized}'")
+                warnings = _add_warning(warnings, f"Date format normalized from '{value_str}' to '{normalized}'")
                 return ValidationResult(normalized, warnings, 0.0)
             except ValueError:
                 continue
 
         # Could not parse
-        warnings.append(f"Could not parse date: {value_str}")
+        warnings = _add_warning(warnings, f"Could not parse date: {value_str}")
         return ValidationResult(value_str, warnings, -0.2)
 
     def validate_currency(self, value: Any, field_path: str) -> ValidationResult:
@@ -154,36 +427,41 @@ class ValidationService:
         Returns:
             ValidationResult with normalized currency (numeric, 2 decimals)
         """
-        warnings = []
+        warnings = None
 
         # Convert to string for processing
-        value_str = str(value).strip()
-
-        # Remove currency symbols and commas
-        cleaned = re.sub(r'[$,€£¥]', '', value_str)
+        value_str = _as_str(value).strip()
 
         try:
-            # Convert to Decimal for precision
-            amount = Decimal(cleaned)
+            if _is_cent_precision_number(value):
+                # Numbers from structured output are already exact to the
+                # cent, so the Decimal round-trip would return them unchanged
+                normalized = float(value)
+            else:
+                # Remove currency symbols and commas
+                cleaned = value_str.translate(_CURRENCY_STRIP)
 
-            # Round to 2 decimal places
-            normalized = float(round(amount, 2))
+                # Convert to Decimal for precision
+                amount = Decimal(cleaned)
+
+                # Round to 2 decimal places
+                normalized = float(round(amount, 2))
 
             # Sanity checks
             if normalized < 0:
-                warnings.append(f"Negative currency value: {normalized}")
+                warnings = _add_warning(warnings, f"Negative currency value: {normalized}")
                 # Don't adjust confidence - negative might be valid (credits)
 
             if normalized > 100_000_000:  # $100M
-                warnings.append(f"Unusually large currency value: ${normalized:,.2f}")
+                warnings = _add_warning(warnings, f"Unusually large currency value: ${normalized:,.2f}")
 
             if value_str != str(normalized):
-                warnings.append(f"Currency normalized from '{value_str}' to '{normalized}'")
+                warnings = _add_warning(warnings, f"Currency normalized from '{value_str}' to '{normalized}'")
 
             return ValidationResult(normalized, warnings)
 
         except (ValueError, TypeError, InvalidOperation):
-            warnings.append(f"Could not parse currency: {value}")
+            warnings = _add_warning(warnings, f"Could not parse currency: {value}")
             return ValidationResult(value, warnings, -0.2)
 
     def validate_number(self, value: Any, field_path: str) -> ValidationResult:
@@ -197,25 +475,28 @@ class ValidationService:
         Returns:
             ValidationResult with normalized number
         """
-        warnings = []
+        warnings = None
 
         try:
-            # Remove commas and convert
-            cleaned = str(value).replace(',', '').strip()
-            num = float(cleaned)
+            if _is_plain_number(value):
+                num = float(value)
+            else:
+                # Remove commas and convert
+                cleaned = _as_str(value).replace(',', '').strip()
+                num = float(cleaned)
 
             # Check for reasonable ranges based on field name
-            if 'month' in field_path.lower():
+            if 'month' in _path_keywords(field_path):
                 if num < 0 or num > 1200:  # 100 years in months
-                    warnings.append(f"Unusual month value: {num}")
+                    warnings = _add_warning(warnings, f"Unusual month value: {num}")
 
             if value != num:
-                warnings.append(f"Number normalized from '{value}' to '{num}'")
+                warnings = _add_warning(warnings, f"Number normalized from '{value}' to '{num}'")
 
             return ValidationResult(num, warnings)
 
         except (ValueError, TypeError):
-            warnings.append(f"Could not parse number: {value}")
+            warnings = _add_warning(warnings, f"Could not parse number: {value}")
             return ValidationResult(value, warnings, -0.2)
 
     def validate_percentage(self, value: Any, field_path: str) -> ValidationResult:
@@ -229,26 +510,29 @@ class ValidationService:
         Returns:
             ValidationResult with normalized percentage (as decimal)
         """
-        warnings = []
+        warnings = None
 
         try:
-            # Remove % symbol if present
-            value_str = str(value).replace('%', '').strip()
-            pct = float(value_str)
+            if _is_plain_number(value):
+                pct = float(value)
+            else:
+                # Remove % symbol if present
+                value_str = _as_str(value).replace('%', '').strip()
+                pct = float(value_str)
 
             # If given as percentage (>1), convert to decimal
             if pct > 1:
                 pct = pct / 100
-                warnings.append(f"Percentage converted from {value} to {pct}")
+                warnings = _add_warning(warnings, f"Percentage converted from {value} to {pct}")
 
             # Validate range
             if pct < 0 or pct > 1:
-                warnings.append(f"Percentage {pct} outside valid range [0, 1]")
+                warnings = _add_warning(warnings, f"Percentage {pct} outside valid range [0, 1]")
 
             return ValidationResult(round(pct, 4), warnings)
 
         except (ValueError, TypeError):
-            warnings.append(f"Could not parse percentage: {value}")
+            warnings = _add_warning(warnings, f"Could not parse percentage: {value}")
             return ValidationResult(value, warnings, -0.2)
 
     def validate_area(self, value: Any, field_path: str) -> ValidationResult:
@@ -262,36 +546,36 @@ class ValidationService:
         Returns:
             ValidationResult with normalized area (numeric)
         """
-        warnings = []
-
-        # Remove "SF", "square feet", etc
-        value_str = str(value)
-        cleaned = re.sub(r'(?i)\s*(sf|square\s+feet|sq\.?\s*ft\.?|rsf|usf)', '', value_str)
-        cleaned = cleaned.replace(',', '').strip()
+        warnings = None
 
         try:
-            area = float(cleaned)
+            if _is_plain_number(value):
+                area = float(value)
+            else:
+                # Remove "SF", "square feet", etc
+                cleaned = _AREA_CLEAN_RE.sub('', _as_str(value)).strip()
+                area = float(cleaned)
 
             # Sanity checks
             if area < 1:
-                warnings.append(f"Very small area: {area} SF")
+                warnings = _add_warning(warnings, f"Very small area: {area} SF")
             elif area > 10_000_000:  # 10 million SF
-                warnings.append(f"Very large area: {area:,.0f} SF")
+                warnings = _add_warning(warnings, f"Very large area: {area:,.0f} SF")
 
-            if 'rentable' in field_path.lower():
+            if 'rentable' in _path_keywords(field_path):
                 if area < 10:
-                    warnings.append("Rentable area suspiciously small")
-            elif 'usable' in field_path.lower():
+                    warnings = _add_warning(warnings, "Rentable area suspiciously small")
+            elif 'usable' in _path_keywords(field_path):
                 if area < 10:
-                    warnings.append("Usable area suspiciously small")
+                    warnings = _add_warning(warnings, "Usable area suspiciously small")
 
-            if str(value) != str(area):
-                warnings.append(f"Area normalized from '{value}' to '{area}'")
+            if _as_str(value) != str(area):
+                warnings = _add_warning(warnings, f"Area normalized from '{value}' to '{area}'")
 
             return ValidationResult(area, warnings)
 
         except (ValueError, TypeError):
-            warnings.append(f"Could not parse area: {value}")
+            warnings = _add_warning(warnings, f"Could not parse area: {value}")
             return ValidationResult(value, warnings, -0.2)
 
     def validate_boolean(self, value: Any, field_path: str) -> ValidationResult:
@@ -305,18 +589,19 @@ class ValidationService:
         Returns:
             ValidationResult with normalized boolean
         """
-        warnings = []
+        warnings = None
 
-        # Convert various representations to bool
-        true_values = {'true', 't', 'yes', 'y', '1', 'True', True, 1}
-        false_values = {'false', 'f', 'no', 'n', '0', 'False', False, 0}
+        if isinstance(value, bool):
+            return ValidationResult(value, warnings)
 
-        if value in true_values:
+        # Convert various representations to bool
+        key = value.strip().lower() if isinstance(value, str) else value
+        if key in _TRUE_VALUES:
             return ValidationResult(True, warnings)
-        elif value in false_values:
+        elif key in _FALSE_VALUES:
             return ValidationResult(False, warnings)
         else:
-            warnings.append(f"Could not parse boolean: {value}")
+            warnings = _add_warning(warnings, f"Could not parse boolean: {value}")
             return ValidationResult(None, warnings, -0.2)
 
     def validate_address(self, value: str, field_path: str) -> ValidationResult:
@@ -330,27 +615,34 @@ class ValidationService:
         Returns:
             ValidationResult with normalized address
         """
-        warnings = []
+        warnings = None
 
-        value_str = str(value).strip()
+        value_str = _as_str(value).strip()
 
         # Check for suite/unit in main address (should be separate)
-        suite_pattern = r'(?i)(suite|ste\.?|unit|#)\s*[\w\d-]+'
-        if re.search(suite_pattern, value_str):
-            if 'suite' not in field_path.lower():
-                warnings.append("Suite/unit found in address - consider extracting separately")
+        if _SUITE_RE.search(value_str):
+            if 'suite' not in _path_keywords(field_path):
+                warnings = _add_warning(warnings, "Suite/unit found in address - consider extracting separately")
 
         # Check for basic address components
-        has_number = bool(re.search(r'\b\d+\b', value_str))
-        has_state = bool(re.search(r'\b[A-Z]{2}\b', value_str))
-        has_zip = bool(re.search(r'\b\d{5}(-\d{4})?\b', value_str))
+        has_number = has_state = has_zip = False
+        for match in _ADDR_COMPONENTS_RE.finditer(value_str):
+            group = match.lastgroup
+            if group == 'zip':
+                has_zip = has_number = True
+            elif group == 'num':
+                has_number = True
+            else:
+                has_state = True
+            if has_number and has_state and has_zip:
+                break
 
         if not has_number:
-            warnings.append("Address missing street number")
+            warnings = _add_warning(warnings, "Address missing street number")
         if not has_state:
-            warnings.append("Address missing state abbreviation")
+            warnings = _add_warning(warnings, "Address missing state abbreviation")
         if not has_zip:
-            warnings.append("Address missing ZIP code")
+            warnings = _add_warning(warnings, "Address missing ZIP code")
 
         return ValidationResult(value_str, warnings)
 
@@ -365,12 +657,12 @@ class ValidationService:
         Returns:
             ValidationResult with normalized text
         """
-        warnings = []
-        text = str(value).strip()
+        warnings = None
+        text = _as_str(value).strip()
 
         # Check for suspiciously short values
-        if len(text) < 2 and 'name' in field_path.lower():
-            warnings.append(f"Suspiciously short {field_path}: '{text}'")
+        if len(text) < 2 and 'name' in _path_keywords(field_path):
+            warnings = _add_warning(warnings, f"Suspiciously short {field_path}: '{text}'")
 
         return ValidationResult(text, warnings)
 
@@ -398,8 +690,8 @@ class ValidationService:
             comm_date = all_extractions.get('dates.commencement_date')
             if comm_date:
                 try:
-                    exp = datetime.strptime(str(value), '%Y-%m-%d')
-                    comm = datetime.strptime(str(comm_date), '%Y-%m-%d')
+                    exp = _parse_iso(_as_str(value))
+                    comm = _parse_iso(_as_str(comm_date))
                     if exp <= comm:
                         warnings.append("Expiration date should be after commencement date")
                 except ValueError:
@@ -456,10 +748,12 @@ class ValidationService:
             exp = all_extractions.get('dates.expiration_date')
             if comm and exp:
                 try:
-                    comm_dt = datetime.strptime(str(comm), '%Y-%m-%d')
-                    exp_dt = datetime.strptime(str(exp), '%Y-%m-%d')
-                    delta = exp_dt - comm_dt
-                    calculated_months = delta.days / 30.44  # Average days per month
+                    # Day counts as plain ints; parsed dates are cached
+                    days = (
+                        _parse_iso(_as_str(exp)).toordinal()
+                        - _parse_iso(_as_str(comm)).toordinal()
+                    )
+                    calculated_months = days / 30.44  # Average days per month
                     stated_months = float(value)
                     diff = abs(calculated_months - stated_months)
                     if diff > 1:  # More than 1 month difference
@@ -475,3 +769,8 @@ class ValidationService:
 
 # Singleton instance
 validation_service = ValidationService()
+
+
+def _validate_lease(fields: Dict[str, Tuple[Any, str]]) -> Dict[str, ValidationResult]:
+    """Validate one lease in a worker process."""
+    return validation_service.validate_all(fields)
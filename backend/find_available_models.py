@@ -1,18 +1,29 @@
 #!/usr/bin/env python3
 """Find all available Claude models for this API key."""
-import os
-from dotenv import load_dotenv
-from anthropic import Anthropic
+import argparse
+import asyncio
+import json
+import time
+from pathlib import Path
 
-load_dotenv()
+from _probe_utils import (
+    classify_error,
+    create_async_probe_client,
+    get_probe_pdf_b64,
+    load_api_key,
+    pdf_probe_messages,
+)
 
-api_key = os.getenv('ANTHROPIC_API_KEY')
-client = Anthropic(api_key=api_key)
+api_key = load_api_key()
 
-print("=" * 80)
-print("COMPREHENSIVE MODEL AVAILABILITY TEST")
-print("=" * 80)
-print()
+# Probes are pure network round-trips, so run them concurrently, but pace
+# request starts to stay under typical tier rate limits
+MAX_CONCURRENT_PROBES = 10
+MAX_PROBES_PER_SECOND = 5
+
+# Probe outcomes are cached so re-runs only hit the API for stale models
+CACHE_PATH = Path.home() / '.leasebee' / 'model_cache.json'
+CACHE_TTL_SECONDS = 24 * 60 * 60
 
 # Comprehensive list of possible model names
 models_to_test = [
@@ -47,110 +58,228 @@ models_to_test = [
     "claude-instant-1",
 ]
 
-working_models = []
-working_pdf_models = []
-
-print("Testing basic text support...")
-print("-" * 80)
 
-for model in models_to_test:
+def _load_cache():
+    """Load cached probe outcomes, or an empty cache if none is readable."""
     try:
-        response = client.messages.create(
-            model=model,
-            max_tokens=10,
-            messages=[{"role": "user", "content": "Test"}]
-        )
-        print(f"✅ {model:<40} WORKS (text)")
-        working_models.append(model)
-    except Exception as e:
-        error_str = str(e)
-        if '404' in error_str or 'not_found' in error_str:
-            print(f"❌ {model:<40} Not found (404)")
-        elif '401' in error_str or 'unauthorized' in error_str:
-            print(f"🔒 {model:<40} Unauthorized (401)")
-        elif '429' in error_str:
-            print(f"⏸️  {model:<40} Rate limited (429)")
-        else:
-            print(f"❓ {model:<40} Error: {str(e)[:50]}")
+        return json.loads(CACHE_PATH.read_text())
+    except (OSError, ValueError):
+        return {}
 
-print()
-print("=" * 80)
-print(f"FOUND {len(working_models)} WORKING MODEL(S)")
-print("=" * 80)
 
-if working_models:
-    print()
-    print("Testing PDF support for working models...")
-    print("-" * 80)
+def _save_cache(cache):
+    """Persist probe outcomes."""
+    CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+    CACHE_PATH.write_text(json.dumps(cache, indent=2, sort_keys=True))
+
+
+def _cached_outcome(cache, model, key):
+    """Return a fresh cached outcome for model, or None if it must be probed."""
+    entry = cache.get(model, {})
+    if key not in entry or time.time() - entry.get('checked_at', 0) >= CACHE_TTL_SECONDS:
+        return None
+    return entry[key]
+
+
+class ProbeLimiter:
+    """Cap in-flight probes and space out their start times."""
+
+    def __init__(self, max_concurrent, per_second):
+        self._semaphore = asyncio.Semaphore(max_concurrent)
+        self._interval = 1.0 / per_second
+        self._next_start = 0.0
 
-    # Create a minimal test PDF bytes
-    import fitz
-    doc = fitz.open()
-    page = doc.new_page()
-    page.insert_text((50, 50), "Test")
-    pdf_bytes = doc.tobytes()
-    doc.close()
+    async def __aenter__(self):
+        await self._semaphore.acquire()
+        # Reserve the next start slot before sleeping so waiters queue up
+        now = asyncio.get_running_loop().time()
+        start = max(now, self._next_start)
+        self._next_start = start + self._interval
+        if start > now:
+            await asyncio.sleep(start - now)
 
-    import base64
-    pdf_base64 = base64.b64encode(pdf_bytes).decode('utf-8')
+    async def __aexit__(self, *exc_info):
+        self._semaphore.release()
 
-    for model in working_models:
+
+async def probe_text(client, limiter, model):
+    """Probe a model with a short text message. Returns (model, error)."""
+    async with limiter:
         try:
-            response = client.messages.create(
+            await client.messages.create(
                 model=model,
                 max_tokens=10,
-                messages=[{
-                    "role": "user",
-                    "content": [
-                        {
-                            "type": "document",
-                            "source": {
-                                "type": "base64",
-                                "media_type": "application/pdf",
-                                "data": pdf_base64,
-                            },
-                        },
-                        {"type": "text", "text": "What does this say?"}
-                    ]
-                }]
+                messages=[{"role": "user", "content": "Test"}]
             )
-            print(f"✅ {model:<40} PDF SUPPORT ✓")
-            working_pdf_models.append(model)
+            return model, None
         except Exception as e:
-            error_str = str(e)
-            if 'does not support PDF' in error_str or 'document' in error_str.lower():
+            return model, e
+
+
+async def probe_pdf(client, limiter, model, pdf_base64):
+    """Probe a model with a tiny PDF document. Returns (model, error)."""
+    async with limiter:
+        try:
+            await client.messages.create(
+                model=model,
+                max_tokens=10,
+                messages=pdf_probe_messages(pdf_base64, "What does this say?")
+            )
+            return model, None
+        except Exception as e:
+            return model, e
+
+
+async def main(force=False, probe_all=False):
+    client = create_async_probe_client(api_key)
+    limiter = ProbeLimiter(MAX_CONCURRENT_PROBES, MAX_PROBES_PER_SECOND)
+    # Load (or build) the probe PDF in a worker thread while the text
+    # probes are in flight, so the PDF stage can start immediately
+    pdf_task = asyncio.create_task(asyncio.to_thread(get_probe_pdf_b64))
+    cache = {} if force else _load_cache()
+
+    print("=" * 80)
+    print("COMPREHENSIVE MODEL AVAILABILITY TEST")
+    print("=" * 80)
+    print()
+
+    working_models = []
+    working_pdf_models = []
+
+    print("Testing basic text support...")
+    print("-" * 80)
+
+    to_probe = [m for m in models_to_test if _cached_outcome(cache, m, 'text_ok') is None]
+    probed = dict(await asyncio.gather(
+        *(probe_text(client, limiter, model) for model in to_probe)
+    ))
+
+    for model in models_to_test:
+        if model not in probed:
+            if _cached_outcome(cache, model, 'text_ok'):
+                print(f"✅ {model:<40} WORKS (text, cached)")
+                working_models.append(model)
+            else:
+                print(f"❌ {model:<40} Not found (404, cached)")
+            continue
+
+        error = probed[model]
+        if error is None:
+            # A fresh text probe invalidates any older PDF outcome
+            cache[model] = {'text_ok': True, 'checked_at': time.time()}
+            print(f"✅ {model:<40} WORKS (text)")
+            working_models.append(model)
+            continue
+        kind = classify_error(error)
+        if kind == 'not_found':
+            cache[model] = {'text_ok': False, 'checked_at': time.time()}
+            print(f"❌ {model:<40} Not found (404)")
+        elif kind == 'unauthorized':
+            print(f"🔒 {model:<40} Unauthorized (401)")
+        elif kind == 'rate_limited':
+            print(f"⏸️  {model:<40} Rate limited (429)")
+        else:
+            print(f"❓ {model:<40} Error: {str(error)[:50]}")
+
+    print()
+    print("=" * 80)
+    print(f"FOUND {len(working_models)} WORKING MODEL(S)")
+    print("=" * 80)
+
+    if working_models:
+        print()
+        print("Testing PDF support for working models...")
+        print("-" * 80)
+
+        pdf_base64 = await pdf_task
+
+        # Probes run concurrently but are consumed in list order, so the
+        # recommended model is the same one a full sweep would pick
+        tasks = {}
+        for model in working_models:
+            cached = _cached_outcome(cache, model, 'pdf_ok')
+            if cached is None:
+                tasks[model] = asyncio.ensure_future(
+                    probe_pdf(client, limiter, model, pdf_base64)
+                )
+            elif cached and not probe_all:
+                break
+
+        for index, model in enumerate(working_models):
+            if working_pdf_models and not probe_all:
+                for task in tasks.values():
+                    task.cancel()
+                for skipped in working_models[index:]:
+                    print(f"⏭️  {skipped:<40} Skipped (use --all to probe)")
+                break
+
+            if model not in tasks:
+                if _cached_outcome(cache, model, 'pdf_ok'):
+                    print(f"✅ {model:<40} PDF SUPPORT ✓ (cached)")
+                    working_pdf_models.append(model)
+                else:
+                    print(f"❌ {model:<40} No PDF support (cached)")
+                continue
+
+            _, error = await tasks.pop(model)
+            if error is None:
+                cache.setdefault(model, {'text_ok': True, 'checked_at': time.time()})['pdf_ok'] = True
+                print(f"✅ {model:<40} PDF SUPPORT ✓")
+                working_pdf_models.append(model)
+                continue
+            if classify_error(error) == 'no_pdf':
+                cache.setdefault(model, {'text_ok': True, 'checked_at': time.time()})['pdf_ok'] = False
                 print(f"❌ {model:<40} No PDF support")
             else:
-                print(f"❓ {model:<40} Error: {str(e)[:50]}")
-
-print()
-print("=" * 80)
-print("SUMMARY")
-print("=" * 80)
-print()
-print(f"Models with text support: {len(working_models)}")
-for m in working_models:
-    print(f"  - {m}")
-print()
-print(f"Models with PDF support: {len(working_pdf_models)}")
-for m in working_pdf_models:
-    print(f"  ✅ {m} ← USE THIS ONE!")
-print()
-
-if not working_pdf_models:
-    print("⚠️  NO MODELS WITH PDF SUPPORT FOUND")
+                print(f"❓ {model:<40} Error: {str(error)[:50]}")
+
+    _save_cache(cache)
+
+    print()
+    print("=" * 80)
+    print("SUMMARY")
+    print("=" * 80)
+    print()
+    print(f"Models with text support: {len(working_models)}")
+    for m in working_models:
+        print(f"  - {m}")
     print()
-    print("This could mean:")
-    print("  1. Your API key is on a restricted tier")
-    print("  2. PDF support requires account upgrade")
-    print("  3. There's a regional or workspace restriction")
+    print(f"Models with PDF support: {len(working_pdf_models)}")
+    for m in working_pdf_models:
+        print(f"  ✅ {m} ← USE THIS ONE!")
     print()
-    print("Check: https://console.anthropic.com/settings/plans")
-else:
-    print("✅ READY TO USE!")
+
+    if not working_pdf_models:
+        print("⚠️  NO MODELS WITH PDF SUPPORT FOUND")
+        print()
+        print("This could mean:")
+        print("  1. Your API key is on a restricted tier")
+        print("  2. PDF support requires account upgrade")
+        print("  3. There's a regional or workspace restriction")
+        print()
+        print("Check: https://console.anthropic.com/settings/plans")
+    else:
+        print("✅ READY TO USE!")
+        print()
+        print(f"Update your .env file:")
+        print(f"ANTHROPIC_MODEL={working_pdf_models[0]}")
+
     print()
-    print(f"Update your .env file:")
-    print(f"ANTHROPIC_MODEL={working_pdf_models[0]}")
+    print("=" * 80)
+
 
-print()
-print("=" * 80)
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        '--force',
+        action='store_true',
+        help=f"Ignore cached results in {CACHE_PATH} and re-probe every model",
+    )
+    parser.add_argument(
+        '--all',
+        action='store_true',
+        dest='probe_all',
+        help="Probe PDF support on every working model instead of stopping at the first",
+    )
+    args = parser.parse_args()
+    asyncio.run(main(force=args.force, probe_all=args.probe_all))
@@ -1,26 +1,43 @@
 #!/usr/bin/env python3
 """Detailed review of extraction results."""
+import bisect
+import mmap
 import sys
 from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).parent))
 
-from app.services.claude_service import claude_service
+
+def write_lines(lines):
+    """Write a block of report lines with a single call."""
+    sys.stdout.write("\n".join(lines) + "\n")
+
+
+def bucket_lines(icon, rows):
+    """Render (field, value, confidence) rows for one confidence bucket."""
+    return [f"  {icon} {field:<40} = {str(value)[:30]:<30} ({conf:.2f})" for field, value, conf in rows]
+
 
 print("=" * 80)
 print("DETAILED EXTRACTION REVIEW")
 print("=" * 80)
 print()
 
-# Load PDF
+# Load PDF, mapped so it is base64-encoded without an intermediate copy
 pdf_path = Path(__file__).parent / "tests/fixtures/test_leases/sample_lease.pdf"
-with open(pdf_path, 'rb') as f:
-    pdf_bytes = f.read()
+with open(pdf_path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as pdf_bytes:
+    # Imported once the PDF is open, so a missing file fails before the
+    # app is initialized
+    from app.services.claude_service import claude_service
 
-# Extract
-print("Extracting...")
-result = claude_service.extract_lease_data_with_refinement(pdf_bytes)
-print("Done!\n")
+    # Extract
+    print("Extracting...")
+    result = claude_service.extract_lease_data_with_refinement(pdf_bytes)
+    print("Done!\n")
+
+# The rest is report rendering with no waits, so stop flushing on every
+# line and let stdout write the report in large blocks
+sys.stdout.reconfigure(line_buffering=False)
 
 # Analyze results
 extractions = result['extractions']
@@ -34,45 +51,35 @@ print("1. EXTRACTION QUALITY BY CONFIDENCE LEVEL")
 print("=" * 80)
 print()
 
-# Group by confidence
-high_conf = []  # >= 0.9
-medium_conf = []  # 0.7-0.89
-low_conf = []  # < 0.7
+# Group by confidence in one pass: bucket 0 is < 0.7, 1 is 0.7-0.89,
+# 2 is >= 0.9
+CONFIDENCE_BOUNDARIES = [0.7, 0.9]
+low_conf, medium_conf, high_conf = buckets = ([], [], [])
 null_vals = []
 
 for field, value in extractions.items():
     conf = confidence.get(field, 0.0)
     if value is None:
         null_vals.append((field, conf))
-    elif conf >= 0.9:
-        high_conf.append((field, value, conf))
-    elif conf >= 0.7:
-        medium_conf.append((field, value, conf))
     else:
-        low_conf.append((field, value, conf))
+        buckets[bisect.bisect_right(CONFIDENCE_BOUNDARIES, conf)].append((field, value, conf))
 
-print(f"High Confidence (≥0.9): {len(high_conf)} fields")
-for field, value, conf in high_conf[:10]:
-    print(f"  ✅ {field:<40} = {str(value)[:30]:<30} ({conf:.2f})")
+lines = [f"High Confidence (≥0.9): {len(high_conf)} fields"]
+lines += bucket_lines("✅", high_conf[:10])
 if len(high_conf) > 10:
-    print(f"  ... and {len(high_conf) - 10} more")
+    lines.append(f"  ... and {len(high_conf) - 10} more")
 
-print()
-print(f"Medium Confidence (0.7-0.89): {len(medium_conf)} fields")
-for field, value, conf in medium_conf:
-    print(f"  🟡 {field:<40} = {str(value)[:30]:<30} ({conf:.2f})")
+lines += ["", f"Medium Confidence (0.7-0.89): {len(medium_conf)} fields"]
+lines += bucket_lines("🟡", medium_conf)
 
-print()
-print(f"Low Confidence (<0.7): {len(low_conf)} fields")
-for field, value, conf in low_conf:
-    print(f"  🔴 {field:<40} = {str(value)[:30]:<30} ({conf:.2f})")
+lines += ["", f"Low Confidence (<0.7): {len(low_conf)} fields"]
+lines += bucket_lines("🔴", low_conf)
 
-print()
-print(f"Null/Missing: {len(null_vals)} fields")
-for field, conf in null_vals[:10]:
-    print(f"  ⚪ {field:<40} (confidence: {conf:.2f})")
+lines += ["", f"Null/Missing: {len(null_vals)} fields"]
+lines += [f"  ⚪ {field:<40} (confidence: {conf:.2f})" for field, conf in null_vals[:10]]
 if len(null_vals) > 10:
-    print(f"  ... and {len(null_vals) - 10} more")
+    lines.append(f"  ... and {len(null_vals) - 10} more")
+write_lines(lines)
 
 print()
 print("=" * 80)
@@ -20,6 +20,13 @@ pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
 def create_admin_user(email, password, org_name):
     """Create admin user and organization."""
+    # Hash before opening the session so bcrypt doesn't hold a connection
+    try:
+        hashed_password = pwd_context.hash(password)
+    except Exception as e:
+        print(f"❌ Error creating admin user: {e}")
+        return False
+
     db = SessionLocal()
     
     try:
@@ -37,22 +44,19 @@ def create_admin_user(email, password, org_name):
             plan="FREE"
         )
         db.add(org)
-        db.commit()
-        db.refresh(org)
-        print(f"✅ Created organization: {org.name} ({org.id})")
         
         # Create admin user
         user = User(
             id=uuid.uuid4(),
             email=email,
             name="Admin User",
-            hashed_password=pwd_context.hash(password),
+            hashed_password=hashed_password,
             is_active=True
         )
         db.add(user)
-        db.commit()
-        db.refresh(user)
-        print(f"✅ Created user: {user.email} ({user.id})")
+        # Flush so the org and user rows exist before the membership row,
+        # keeping everything in one transaction
+        db.flush()
         
         # Add user to organization as admin
         member = OrganizationMember(
@@ -61,7 +65,13 @@ def create_admin_user(email, password, org_name):
             role="ADMIN"
         )
         db.add(member)
+        # Read what the summary needs before committing: commit expires the
+        # instances, and touching them afterwards would refresh each one
+        org_id, org_display_name = org.id, org.name
+        user_id, user_email = user.id, user.email
         db.commit()
+        print(f"✅ Created organization: {org_display_name} ({org_id})")
+        print(f"✅ Created user: {user_email} ({user_id})")
         print(f"✅ Added user to organization as ADMIN")
         
         print("\n" + "="*60)
@@ -69,7 +79,7 @@ def create_admin_user(email, password, org_name):
         print("="*60)
         print(f"Email: {email}")
         print(f"Password: {password}")
-        print(f"Organization: {org.name}")
+        print(f"Organization: {org_display_name}")
         print("\n⚠️  IMPORTANT: Change this password after first login!")
         print("="*60)
         
@@ -1,10 +1,33 @@
 #!/usr/bin/env python3
 """Generate a secure SECRET_KEY for the backend."""
+import argparse
+import base64
 import secrets
 
+KEY_BYTES = 32
+
+
+def generate_keys(count):
+    """Generate count URL-safe keys from a single read of the OS CSPRNG."""
+    buf = secrets.token_bytes(KEY_BYTES * count)
+    return [
+        base64.urlsafe_b64encode(buf[i:i + KEY_BYTES]).rstrip(b'=').decode('ascii')
+        for i in range(0, len(buf), KEY_BYTES)
+    ]
+
+
 if __name__ == "__main__":
-    secret_key = secrets.token_urlsafe(32)
-    print("Generated SECRET_KEY:")
-    print(secret_key)
-    print("\nAdd this to your Railway backend environment variables:")
-    print(f"SECRET_KEY={secret_key}")
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--count', type=int, default=1, help="Number of keys to generate")
+    args = parser.parse_args()
+    if args.count < 1:
+        parser.error("--count must be at least 1")
+
+    if args.count == 1:
+        secret_key = generate_keys(1)[0]
+        print("Generated SECRET_KEY:")
+        print(secret_key)
+        print("\nAdd this to your Railway backend environment variables:")
+        print(f"SECRET_KEY={secret_key}")
+    else:
+        print("\n".join(generate_keys(args.count)))
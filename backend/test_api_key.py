@@ -1,25 +1,21 @@
 #!/usr/bin/env python3
 """Test Anthropic API key and available models."""
-import os
-from dotenv import load_dotenv
-from anthropic import Anthropic
+from _probe_utils import classify_error, create_probe_client, describe_api_key, load_api_key
 
-load_dotenv()
-
-api_key = os.getenv('ANTHROPIC_API_KEY')
+api_key = load_api_key()
 
 print("="* 80)
 print("ANTHROPIC API KEY TEST")
 print("=" * 80)
 print()
-print(f"API Key: {api_key[:20]}..." if api_key else "API Key: NOT SET")
+print(describe_api_key(api_key))
 print()
 
 if not api_key or api_key == 'your_anthropic_api_key_here':
     print("❌ API key not set properly")
     exit(1)
 
-client = Anthropic(api_key=api_key)
+client = create_probe_client(api_key)
 
 # Test models
 models_to_test = [
@@ -46,15 +42,15 @@ for model in models_to_test:
         print()
         break  # Found a working model
     except Exception as e:
-        error_str = str(e)
-        if '404' in error_str or 'not_found' in error_str:
+        kind = classify_error(e)
+        if kind == 'not_found':
             print(f"❌ {model} - Model not found (404)")
-        elif '401' in error_str or 'unauthorized' in error_str:
+        elif kind == 'unauthorized':
             print(f"❌ {model} - Authentication error (401)")
-        elif '429' in error_str or 'rate_limit' in error_str:
+        elif kind == 'rate_limited':
             print(f"⚠️  {model} - Rate limited (429)")
         else:
-            print(f"❌ {model} - Error: {error_str[:100]}")
+            print(f"❌ {model} - Error: {str(e)[:100]}")
 
 print()
 print("=" * 80)
@@ -1,22 +1,20 @@
 #!/usr/bin/env python3
 """Test Claude API connection."""
 import os
-from anthropic import Anthropic
 
-# Load from .env
-from dotenv import load_dotenv
-load_dotenv()
+from _probe_utils import create_probe_client, describe_api_key, load_api_key
 
-api_key = os.getenv('ANTHROPIC_API_KEY')
+# Load from .env
+api_key = load_api_key()
 model = os.getenv('ANTHROPIC_MODEL', 'claude-sonnet-4-5-20250929')
 
 print(f"Testing Claude API...")
-print(f"API Key: {api_key[:20]}..." if api_key else "API Key: NOT SET")
+print(describe_api_key(api_key))
 print(f"Model: {model}")
 print()
 
 try:
-    client = Anthropic(api_key=api_key)
+    client = create_probe_client(api_key)
     response = client.messages.create(
         model=model,
         max_tokens=100,
@@ -1,14 +1,15 @@
 #!/usr/bin/env python3
 """Test with CURRENT 2026 model names from official docs."""
-import os
-from dotenv import load_dotenv
-from anthropic import Anthropic
-import base64
+from _probe_utils import (
+    classify_error,
+    create_probe_client,
+    get_probe_pdf_b64,
+    load_api_key,
+    pdf_probe_messages,
+)
 
-load_dotenv()
-
-api_key = os.getenv('ANTHROPIC_API_KEY')
-client = Anthropic(api_key=api_key)
+api_key = load_api_key()
+client = create_probe_client(api_key)
 
 print("=" * 80)
 print("TESTING CURRENT 2026 CLAUDE MODELS (Official Names)")
@@ -29,14 +30,8 @@ current_models = [
     ("claude-3-haiku-20240307", "Claude Haiku 3 (legacy)"),
 ]
 
-# Create minimal test PDF
-import fitz
-doc = fitz.open()
-page = doc.new_page()
-page.insert_text((50, 50), "Test PDF")
-pdf_bytes = doc.tobytes()
-doc.close()
-pdf_base64 = base64.b64encode(pdf_bytes).decode('utf-8')
+# Minimal test PDF, cached across runs
+pdf_base64 = get_probe_pdf_b64()
 
 print("Testing models with PDF support...")
 print("-" * 80)
@@ -48,33 +43,22 @@ for model_id, description in current_models:
         response = client.messages.create(
             model=model_id,
             max_tokens=20,
-            messages=[{
-                "role": "user",
-                "content": [
-                    {
-                        "type": "document",
-                        "source": {
-                            "type": "base64",
-                            "media_type": "application/pdf",
-                            "data": pdf_base64,
-                        },
-                    },
-                    {"type": "text", "text": "What does this PDF say?"}
-                ]
-            }]
+            messages=pdf_probe_messages(pdf_base64, "What does this PDF say?")
         )
         print(f"✅ {model_id:<35} {description}")
         print(f"   Response: {response.content[0].text[:50]}...")
         working_models.append((model_id, description))
         print()
     except Exception as e:
-        error_str = str(e)
-        if '404' in error_str or 'not_found' in error_str:
+        kind = classify_error(e)
+        if kind == 'not_found':
             print(f"❌ {model_id:<35} Not found (may need account upgrade)")
-        elif 'does not support PDF' in error_str or 'document' in error_str:
+        elif kind == 'no_pdf':
             print(f"⚠️  {model_id:<35} No PDF support")
-        elif '401' in error_str or 'unauthorized' in error_str:
+        elif kind == 'unauthorized':
             print(f"🔒 {model_id:<35} Unauthorized (check API key)")
+        elif kind == 'rate_limited':
+            print(f"⏸️  {model_id:<35} Rate limited (429)")
         else:
             print(f"❓ {model_id:<35} Error: {str(e)[:60]}")
 
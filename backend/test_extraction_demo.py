@@ -8,15 +8,57 @@ This script extracts data from the sample PDF and shows:
 - Multi-pass refinement (if any)
 - Comparison with gold standard
 """
+import functools
 import json
+import mmap
+import re
 import sys
 from pathlib import Path
 
 # Add app to path
 sys.path.insert(0, str(Path(__file__).parent))
 
-from app.services.claude_service import claude_service
-from app.schemas.field_schema import get_field_by_path
+GOLD_STANDARD_PATH = Path(__file__).parent / "tests/fixtures/test_leases/gold_standard.json"
+
+# Anything float() could accept once commas are removed; other strings skip
+# the parse attempt entirely
+_NUMBER_LIKE_RE = re.compile(
+    r'\s*[+-]?(?:[\d_.]+(?:e[+-]?[\d_]+)?|inf(?:inity)?|nan)\s*',
+    re.IGNORECASE
+)
+
+
+@functools.lru_cache(maxsize=1)
+def _gold_by_filename():
+    """Parse the gold standard once and index it by lease filename."""
+    with open(GOLD_STANDARD_PATH, 'r') as f:
+        gold_data = json.load(f)
+    index = {}
+    for lease in gold_data.get('leases', []):
+        # First entry wins, as with a linear scan
+        index.setdefault(lease.get('filename'), lease.get('gold_standard', {}))
+    return index
+
+
+def _gold_for(filename):
+    """Return the gold standard fields for a lease file, or None."""
+    return _gold_by_filename().get(filename)
+
+
+def _normalize(value):
+    """Normalize a value for exact comparison."""
+    return str(value).lower().strip() if value is not None else "null"
+
+
+def _as_number(value):
+    """Return value as a float, or None if it is not numeric."""
+    text = str(value).replace(',', '')
+    if not _NUMBER_LIKE_RE.fullmatch(text):
+        return None
+    try:
+        return float(text)
+    except ValueError:
+        return None
 
 
 def main():
@@ -34,29 +76,37 @@ def main():
         print("Please ensure sample_lease.pdf exists in tests/fixtures/test_leases/")
         return 1
 
+    # Imported here so a missing PDF is reported without initializing the app
+    from app.services.claude_service import claude_service
+    from app.schemas.field_schema import get_field_by_path
+
     print(f"📄 Loading PDF: {pdf_path.name}")
-    with open(pdf_path, 'rb') as f:
-        pdf_bytes = f.read()
+    # Map the file instead of reading it; base64 encoding reads the mapping
+    # directly, so the PDF is never copied into a bytes object
+    with open(pdf_path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as pdf_bytes:
+        print(f"   File size: {len(pdf_bytes):,} bytes")
+        print()
 
-    print(f"   File size: {len(pdf_bytes):,} bytes")
-    print()
+        # Extract with multi-pass refinement
+        print("🤖 Extracting with Claude (multi-pass enabled)...")
+        print()
 
-    # Extract with multi-pass refinement
-    print("🤖 Extracting with Claude (multi-pass enabled)...")
-    print()
+        try:
+            result = claude_service.extract_lease_data_with_refinement(
+                pdf_bytes,
+                confidence_threshold=0.70
+            )
+        except Exception as e:
+            print(f"❌ Extraction failed: {str(e)}")
+            print()
+            print("This likely means ANTHROPIC_API_KEY is not set.")
+            print("To run this demo, set your API key:")
+            print("  export ANTHROPIC_API_KEY='your-key-here'")
+            return 1
 
-    try:
-        result = claude_service.extract_lease_data_with_refinement(
-            pdf_bytes,
-            confidence_threshold=0.70
-        )
-    except Exception as e:
-        print(f"❌ Extraction failed: {str(e)}")
-        print()
-        print("This likely means ANTHROPIC_API_KEY is not set.")
-        print("To run this demo, set your API key:")
-        print("  export ANTHROPIC_API_KEY='your-key-here'")
-        return 1
+    # The rest is report rendering with no waits, so stop flushing on
+    # every line and let stdout write the report in large blocks
+    sys.stdout.reconfigure(line_buffering=False)
 
     # Display results
     extractions = result['extractions']
@@ -142,57 +192,42 @@ def main():
         print()
 
     # Load gold standard for comparison
-    gold_standard_path = Path(__file__).parent / "tests/fixtures/test_leases/gold_standard.json"
-
-    if gold_standard_path.exists():
+    if GOLD_STANDARD_PATH.exists():
         print("-" * 80)
         print("ACCURACY COMPARISON")
         print("-" * 80)
 
-        with open(gold_standard_path, 'r') as f:
-            gold_data = json.load(f)
-
-        # Find the gold standard for sample_lease
-        gold_standard = None
-        for lease in gold_data.get('leases', []):
-            if lease.get('filename') == 'sample_lease.pdf':
-                gold_standard = lease.get('gold_standard', {})
-                break
+        gold_standard = _gold_for('sample_lease.pdf')
 
         if gold_standard:
-            correct = 0
-            incorrect = 0
-            missing = 0
             total = len(gold_standard)
 
-            errors = []
+            # Exact matches on normalized values first, then numeric
+            # tolerance only for the fields that are left
+            correct_keys = {
+                k for k, expected in gold_standard.items()
+                if _normalize(expected) == _normalize(extractions.get(k))
+            }
+            missing_keys = {
+                k for k in gold_standard
+                if k not in correct_keys and extractions.get(k) is None
+            }
+            for k in gold_standard.keys() - correct_keys - missing_keys:
+                exp_num = _as_number(gold_standard[k])
+                act_num = _as_number(extractions[k])
+                if exp_num is not None and act_num is not None and abs(exp_num - act_num) < 0.01:
+                    correct_keys.add(k)
+
+            correct = len(correct_keys)
+            missing = len(missing_keys)
+            incorrect = total - correct - missing
 
+            errors = []
             for field_path, expected in gold_standard.items():
-                actual = extractions.get(field_path)
-
-                # Normalize for comparison
-                expected_str = str(expected).lower().strip() if expected is not None else "null"
-                actual_str = str(actual).lower().strip() if actual is not None else "null"
-
-                # Simple comparison (could use the normalize function from test)
-                if expected_str == actual_str:
-                    correct += 1
-                elif actual is None:
-                    missing += 1
+                if field_path in missing_keys:
                     errors.append(f"  ❌ {field_path}: MISSING (expected: {expected})")
-                else:
-                    # Check if it's close enough (for numeric values)
-                    try:
-                        exp_num = float(str(expected).replace(',', ''))
-                        act_num = float(str(actual).replace(',', ''))
-                        if abs(exp_num - act_num) < 0.01:
-                            correct += 1
-                            continue
-                    except (ValueError, TypeError):
-                        # If numeric parsing fails, fall back to treating the value as incorrect below.
-                        pass
-
-                    incorrect += 1
+                elif field_path not in correct_keys:
+                    actual = extractions.get(field_path)
                     errors.append(f"  ❌ {field_path}: got '{actual}', expected '{expected}'")
 
             accuracy = (correct / total * 100) if total > 0 else 0
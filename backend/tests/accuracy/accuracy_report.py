@@ -4,12 +4,110 @@ Accuracy report generation for extraction testing.
 This module generates comprehensive reports comparing extraction accuracy
 over time and identifying areas for improvement.
 """
+import bisect
 import json
 from pathlib import Path
 from typing import Dict, List, Any
 from datetime import datetime
 from collections import defaultdict
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Confidence bucket index from bisect: 0 is low (< 0.7), 1 is medium
+# (0.7-0.89), 2 is high (>= 0.9)
+CONFIDENCE_BOUNDARIES = [0.7, 0.9]
+CONFIDENCE_BUCKET_NAMES = ('Low', 'Medium', 'High')
+
+# Examples shown (and kept) per problematic field
+MAX_PROBLEM_EXAMPLES = 3
+
+# Fixed section headers, formatted once at import
+_PER_LEASE_HEADER = (
+    "PER-LEASE ACCURACY",
+    "-" * 80,
+    f"{'Lease ID':<25} {'Description':<35} {'Accuracy':>10}",
+    "-" * 80,
+)
+_FIELD_CATEGORY_HEADER = (
+    "ACCURACY BY FIELD CATEGORY",
+    "-" * 80,
+    f"{'Category':<30} {'Correct':>10} {'Total':>10} {'Accuracy':>12}",
+    "-" * 80,
+)
+_CONFIDENCE_HEADER = (
+    "CONFIDENCE SCORE ANALYSIS",
+    "-" * 80,
+    f"{'Bucket':<15} {'Correct':>10} {'Incorrect':>10} {'Total':>10} {'Accuracy':>12}",
+    "-" * 80,
+)
+
+
+def load_results(results_file: Path) -> Dict[str, Any]:
+    """
+    Load a results JSON file.
+
+    Uses orjson when it is installed, falling back to the stdlib parser
+    (which also accepts the NaN/Infinity literals orjson rejects).
+
+    Args:
+        results_file: Path to JSON results file
+
+    Returns:
+        Parsed results data
+    """
+    with open(results_file, 'rb') as f:
+        raw = f.read()
+
+    if orjson is not None:
+        try:
+            return orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(raw)
+
+
+def compute_totals(results: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Sum field counts, cost and tokens over all results in a single pass.
+
+    Leases without extraction metadata count as zero cost and tokens, so
+    the accuracy sections don't depend on it.
+
+    Args:
+        results: Per-lease result dicts
+
+    Returns:
+        Totals keyed by correct, incorrect, missing, total_fields,
+        total_cost, input_tokens and output_tokens
+    """
+    correct = incorrect = missing = total_fields = 0
+    total_cost = 0
+    input_tokens = output_tokens = 0
+
+    for r in results:
+        m = r['metrics']
+        md = r.get('metadata') or {}
+        correct += m['correct']
+        incorrect += m['incorrect']
+        missing += m['missing']
+        total_fields += m['total_fields']
+        total_cost += md.get('total_cost', 0)
+        input_tokens += md.get('input_tokens', 0)
+        output_tokens += md.get('output_tokens', 0)
+
+    return {
+        'correct': correct,
+        'incorrect': incorrect,
+        'missing': missing,
+        'total_fields': total_fields,
+        'total_cost': total_cost,
+        'input_tokens': input_tokens,
+        'output_tokens': output_tokens,
+    }
+
 
 class AccuracyReport:
     """Generate comprehensive accuracy reports."""
@@ -21,22 +119,44 @@ class AccuracyReport:
         Args:
             results_file: Path to JSON results file
         """
-        with open(results_file, 'r') as f:
-            self.data = json.load(f)
+        self.data = load_results(results_file)
 
         self.test_date = self.data.get('test_date', 'Unknown')
         self.test_type = self.data.get('test_type', 'Unknown')
         self.results = self.data.get('results', [])
+        self._totals = compute_totals(self.results)
+        # Field paths repeat across leases, so map each to its category once
+        self._field_category = {
+            field_path: field_path.partition('.')[0]
+            for result in self.results
+            for field_path in result['metrics']['field_results']
+        }
+        # (lease_id, truncated description, accuracy, metrics) per lease,
+        # shared by every section that walks the leases
+        self._per_lease = [
+            (
+                result['lease_id'],
+                result['description'][:35],
+                result['metrics']['overall_accuracy'],
+                result['metrics'],
+            )
+            for result in self.results
+        ]
 
     def generate_summary(self) -> str:
         """Generate executive summary of results."""
+        return "\n".join(self._lines_summary())
+
+    def _lines_summary(self) -> List[str]:
+        """Return the executive summary as report lines."""
         if not self.results:
-            return "No results to report."
+            return ["No results to report."]
 
-        total_correct = sum(r['metrics']['correct'] for r in self.results)
-        total_fields = sum(r['metrics']['total_fields'] for r in self.results)
-        total_incorrect = sum(r['metrics']['incorrect'] for r in self.results)
-        total_missing = sum(r['metrics']['missing'] for r in self.results)
+        totals = self._totals
+        total_correct = totals['correct']
+        total_fields = totals['total_fields']
+        total_incorrect = totals['incorrect']
+        total_missing = totals['missing']
 
         overall_accuracy = (total_correct / total_fields * 100) if total_fields > 0 else 0
 
@@ -57,79 +177,84 @@ class AccuracyReport:
         report.append(f"Missing:           {total_missing:6d}")
         report.append("")
 
-        return "\n".join(report)
+        return report
 
     def generate_per_lease_summary(self) -> str:
         """Generate per-lease accuracy breakdown."""
-        if not self.results:
-            return ""
+        return "\n".join(self._lines_per_lease_summary())
 
-        report = []
-        report.append("PER-LEASE ACCURACY")
-        report.append("-" * 80)
-        report.append(f"{'Lease ID':<25} {'Description':<35} {'Accuracy':>10}")
-        report.append("-" * 80)
+    def _lines_per_lease_summary(self) -> List[str]:
+        """Return the per-lease accuracy breakdown as report lines."""
+        if not self.results:
+            return [""]
 
-        for result in self.results:
-            lease_id = result['lease_id']
-            description = result['description'][:35]
-            accuracy = result['metrics']['overall_accuracy']
+        report = list(_PER_LEASE_HEADER)
 
+        for lease_id, description, accuracy, _ in self._per_lease:
             report.append(f"{lease_id:<25} {description:<35} {accuracy:>9.2f}%")
 
         report.append("")
-        return "\n".join(report)
+        return report
 
     def generate_field_category_analysis(self) -> str:
         """Analyze accuracy by field category."""
-        # Aggregate by category across all leases
-        category_stats = defaultdict(lambda: {'correct': 0, 'total': 0})
+        return "\n".join(self._lines_field_category_analysis())
+
+    def _lines_field_category_analysis(self) -> List[str]:
+        """Return the field category analysis as report lines."""
+        # Aggregate by category across all leases, with flat counters
+        correct_by_category = defaultdict(int)
+        total_by_category = defaultdict(int)
+        field_category = self._field_category
 
-        for result in self.results:
-            field_results = result['metrics']['field_results']
+        for _, _, _, metrics in self._per_lease:
+            field_results = metrics['field_results']
 
             for field_path, field_result in field_results.items():
-                category = field_path.split('.')[0]
-                category_stats[category]['total'] += 1
+                category = field_category[field_path]
+                total_by_category[category] += 1
                 if field_result['status'] == 'correct':
-                    category_stats[category]['correct'] += 1
+                    correct_by_category[category] += 1
 
         # Calculate accuracy per category
         category_accuracy = {
-            category: (stats['correct'] / stats['total'] * 100) if stats['total'] > 0 else 0
-            for category, stats in category_stats.items()
+            category: (correct_by_category[category] / total * 100) if total > 0 else 0
+            for category, total in total_by_category.items()
         }
 
         # Sort by accuracy (lowest first to highlight problem areas)
         sorted_categories = sorted(category_accuracy.items(), key=lambda x: x[1])
 
-        report = []
-        report.append("ACCURACY BY FIELD CATEGORY")
-        report.append("-" * 80)
-        report.append(f"{'Category':<30} {'Correct':>10} {'Total':>10} {'Accuracy':>12}")
-        report.append("-" * 80)
+        report = list(_FIELD_CATEGORY_HEADER)
 
         for category, accuracy in sorted_categories:
-            stats = category_stats[category]
             report.append(
-                f"{category:<30} {stats['correct']:>10d} {stats['total']:>10d} {accuracy:>11.2f}%"
+                f"{category:<30} {correct_by_category[category]:>10d} "
+                f"{total_by_category[category]:>10d} {accuracy:>11.2f}%"
             )
 
         report.append("")
-        return "\n".join(report)
+        return report
 
     def generate_problematic_fields(self, top_n: int = 10) -> str:
         """Identify most problematic fields across all leases."""
-        field_errors = defaultdict(lambda: {'count': 0, 'examples': []})
+        return "\n".join(self._lines_problematic_fields(top_n))
+
+    def _lines_problematic_fields(self, top_n: int = 10) -> List[str]:
+        """Return the problematic fields section as report lines."""
+        error_counts = defaultdict(int)
+        error_examples = defaultdict(list)
 
-        for result in self.results:
-            problematic = result['metrics']['problematic_fields']
+        for lease_id, _, _, metrics in self._per_lease:
+            problematic = metrics['problematic_fields']
 
             for problem in problematic:
                 field = problem['field']
-                field_errors[field]['count'] += 1
-                field_errors[field]['examples'].append({
-                    'lease_id': result['lease_id'],
+                error_counts[field] += 1
+                if error_counts[field] > MAX_PROBLEM_EXAMPLES:
+                    continue
+                error_examples[field].append({
+                    'lease_id': lease_id,
                     'issue': problem['issue'],
                     'expected': problem.get('expected'),
                     'actual': problem.get('actual')
@@ -137,8 +262,8 @@ class AccuracyReport:
 
         # Sort by error count
         sorted_fields = sorted(
-            field_errors.items(),
-            key=lambda x: x[1]['count'],
+            error_counts.items(),
+            key=lambda x: x[1],
             reverse=True
         )[:top_n]
 
@@ -146,12 +271,12 @@ class AccuracyReport:
         report.append(f"TOP {top_n} MOST PROBLEMATIC FIELDS")
         report.append("-" * 80)
 
-        for i, (field, data) in enumerate(sorted_fields, 1):
+        for i, (field, count) in enumerate(sorted_fields, 1):
             report.append(f"{i}. {field}")
-            report.append(f"   Errors: {data['count']}")
+            report.append(f"   Errors: {count}")
             report.append(f"   Examples:")
 
-            for example in data['examples'][:3]:  # Show first 3 examples
+            for example in error_examples[field]:
                 report.append(f"     - {example['lease_id']}: {example['issue']}")
                 if example.get('expected'):
                     report.append(f"       Expected: {example['expected']}")
@@ -160,18 +285,23 @@ class AccuracyReport:
 
             report.append("")
 
-        return "\n".join(report)
+        return report
 
     def generate_cost_analysis(self) -> str:
         """Analyze extraction costs."""
+        return "\n".join(self._lines_cost_analysis())
+
+    def _lines_cost_analysis(self) -> List[str]:
+        """Return the cost analysis as report lines."""
         if not self.results:
-            return ""
+            return [""]
 
-        total_cost = sum(r['metadata']['total_cost'] for r in self.results)
-        total_tokens_in = sum(r['metadata']['input_tokens'] for r in self.results)
-        total_tokens_out = sum(r['metadata']['output_tokens'] for r in self.results)
-        total_fields = sum(r['metrics']['total_fields'] for r in self.results)
-        total_correct = sum(r['metrics']['correct'] for r in self.results)
+        totals = self._totals
+        total_cost = totals['total_cost']
+        total_tokens_in = totals['input_tokens']
+        total_tokens_out = totals['output_tokens']
+        total_fields = totals['total_fields']
+        total_correct = totals['correct']
 
         avg_cost_per_lease = total_cost / len(self.results) if self.results else 0
         avg_cost_per_field = total_cost / total_fields if total_fields > 0 else 0
@@ -188,51 +318,40 @@ class AccuracyReport:
         report.append(f"Total Output Tokens:       {total_tokens_out:,}")
         report.append("")
 
-        return "\n".join(report)
+        return report
 
     def generate_confidence_analysis(self) -> str:
         """Analyze confidence score distribution and correlation with accuracy."""
-        confidence_buckets = {
-            'high': {'correct': 0, 'incorrect': 0, 'total': 0},      # >= 0.9
-            'medium': {'correct': 0, 'incorrect': 0, 'total': 0},    # 0.7-0.89
-            'low': {'correct': 0, 'incorrect': 0, 'total': 0},       # < 0.7
-        }
+        return "\n".join(self._lines_confidence_analysis())
 
-        for result in self.results:
-            field_results = result['metrics']['field_results']
+    def _lines_confidence_analysis(self) -> List[str]:
+        """Return the confidence score analysis as report lines."""
+        # [correct, incorrect] counts per confidence bucket
+        counts = [[0, 0] for _ in CONFIDENCE_BUCKET_NAMES]
 
-            for field_path, field_result in field_results.items():
+        for _, _, _, metrics in self._per_lease:
+            field_results = metrics['field_results']
+
+            for field_result in field_results.values():
                 confidence = field_result.get('confidence')
                 if confidence is None:
                     continue
 
-                # Determine bucket
-                if confidence >= 0.9:
-                    bucket = 'high'
-                elif confidence >= 0.7:
-                    bucket = 'medium'
-                else:
-                    bucket = 'low'
+                bucket = counts[bisect.bisect_right(CONFIDENCE_BOUNDARIES, confidence)]
+                bucket[0 if field_result['status'] == 'correct' else 1] += 1
 
-                confidence_buckets[bucket]['total'] += 1
-                if field_result['status'] == 'correct':
-                    confidence_buckets[bucket]['correct'] += 1
-                else:
-                    confidence_buckets[bucket]['incorrect'] += 1
+        report = list(_CONFIDENCE_HEADER)
 
-        report = []
-        report.append("CONFIDENCE SCORE ANALYSIS")
-        report.append("-" * 80)
-        report.append(f"{'Bucket':<15} {'Correct':>10} {'Incorrect':>10} {'Total':>10} {'Accuracy':>12}")
-        report.append("-" * 80)
-
-        for bucket_name in ['high', 'medium', 'low']:
-            bucket = confidence_buckets[bucket_name]
-            accuracy = (bucket['correct'] / bucket['total'] * 100) if bucket['total'] > 0 else 0
+        # Highest bucket first
+        for bucket_name, (correct, incorrect) in zip(
+            reversed(CONFIDENCE_BUCKET_NAMES), reversed(counts)
+        ):
+            total = correct + incorrect
+            accuracy = (correct / total * 100) if total > 0 else 0
 
             report.append(
-                f"{bucket_name.capitalize():<15} {bucket['correct']:>10d} "
-                f"{bucket['incorrect']:>10d} {bucket['total']:>10d} {accuracy:>11.2f}%"
+                f"{bucket_name:<15} {correct:>10d} "
+                f"{incorrect:>10d} {total:>10d} {accuracy:>11.2f}%"
             )
 
         report.append("")
@@ -240,29 +359,30 @@ class AccuracyReport:
         report.append("If low-confidence fields have high accuracy, confidence calibration may be off.")
         report.append("")
 
-        return "\n".join(report)
+        return report
 
     def generate_full_report(self) -> str:
         """Generate complete report with all sections."""
-        sections = [
-            self.generate_summary(),
-            self.generate_per_lease_summary(),
-            self.generate_field_category_analysis(),
-            self.generate_problematic_fields(),
-            self.generate_confidence_analysis(),
-            self.generate_cost_analysis(),
-        ]
-
-        return "\n".join(sections)
-
-    def save_report(self, output_path: Path):
-        """Save report to file."""
+        # Sections contribute lines to one list, joined once at the end
+        lines = []
+        lines.extend(self._lines_summary())
+        lines.extend(self._lines_per_lease_summary())
+        lines.extend(self._lines_field_category_analysis())
+        lines.extend(self._lines_problematic_fields())
+        lines.extend(self._lines_confidence_analysis())
+        lines.extend(self._lines_cost_analysis())
+
+        return "\n".join(lines)
+
+    def save_report(self, output_path: Path) -> str:
+        """Save report to file and return the report text."""
         report = self.generate_full_report()
 
         with open(output_path, 'w') as f:
             f.write(report)
 
         print(f"Report saved to: {output_path}")
+        return report
 
 
 def compare_reports(baseline_file: Path, improved_file: Path) -> str:
@@ -276,20 +396,18 @@ def compare_reports(baseline_file: Path, improved_file: Path) -> str:
     Returns:
         Comparison report string
     """
-    with open(baseline_file, 'r') as f:
-        baseline_data = json.load(f)
-
-    with open(improved_file, 'r') as f:
-        improved_data = json.load(f)
+    baseline_data = load_results(baseline_file)
+    improved_data = load_results(improved_file)
 
     baseline_results = baseline_data.get('results', [])
     improved_results = improved_data.get('results', [])
 
     # Calculate metrics
     def calc_metrics(results):
-        total_correct = sum(r['metrics']['correct'] for r in results)
-        total_fields = sum(r['metrics']['total_fields'] for r in results)
-        total_cost = sum(r['metadata']['total_cost'] for r in results)
+        totals = compute_totals(results)
+        total_correct = totals['correct']
+        total_fields = totals['total_fields']
+        total_cost = totals['total_cost']
         return {
             'accuracy': (total_correct / total_fields * 100) if total_fields > 0 else 0,
             'correct': total_correct,
@@ -372,5 +490,4 @@ if __name__ == '__main__':
         output_file = Path(sys.argv[2]) if len(sys.argv) > 2 else results_file.with_suffix('.txt')
 
         report_gen = AccuracyReport(results_file)
-        report_gen.save_report(output_file)
-        print(report_gen.generate_full_report())
+        print(report_gen.save_report(output_file))
@@ -6,14 +6,37 @@ providing detailed field-by-field comparison and overall metrics.
 """
 import json
 import os
+import re
 import pytest
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Dict, Any, List, Tuple
 from decimal import Decimal
 from datetime import datetime
+from functools import lru_cache
 
 from app.services.claude_service import claude_service
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Extractions are network-bound API calls; keep this within API rate limits
+EXTRACTION_WORKERS = 8
+
+# Set to write baseline results without indentation (e.g. for CI archives)
+COMPACT_RESULTS = bool(os.getenv('ACCURACY_COMPACT_RESULTS'))
+
+# Currency symbols and thousands separators, removed in one translate call
+_CURRENCY_TRANS = str.maketrans('', '', '$,')
+_ISO_DATE_RE = re.compile(r'\d{4}-\d{2}-\d{2}')
+# Non-string scalars that match after normalization whenever they are equal
+# and of the same type (strings can't be short-circuited: "nan" != "nan"
+# once normalized)
+_EXACT_MATCH_TYPES = frozenset((int, float, bool, type(None)))
+
 
 class AccuracyMetrics:
     """Container for accuracy measurement results."""
@@ -49,10 +72,12 @@ class AccuracyMetrics:
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert metrics to dictionary for reporting."""
+        # Recall is the same ratio as overall accuracy, so round it once
+        accuracy_pct = round(self.overall_accuracy * 100, 2)
         return {
-            'overall_accuracy': round(self.overall_accuracy * 100, 2),
+            'overall_accuracy': accuracy_pct,
             'precision': round(self.precision * 100, 2),
-            'recall': round(self.recall * 100, 2),
+            'recall': accuracy_pct,
             'total_fields': self.total_fields,
             'correct': self.correct,
             'incorrect': self.incorrect,
@@ -76,9 +101,25 @@ def normalize_value_for_comparison(value: Any) -> Any:
     Returns:
         Normalized value
     """
+    # Only strings go through the cache: 1, 1.0 and True hash alike but
+    # normalize differently, and lists/dicts aren't hashable
+    if type(value) is str:
+        return _normalize_hashable(value)
+    return _normalize_hashable.__wrapped__(value)
+
+
+@lru_cache(maxsize=8192)
+def _normalize_hashable(value: Any) -> Any:
+    """Normalize a single value; see normalize_value_for_comparison."""
     if value is None:
         return None
 
+    # Plain numbers skip the string round trip (bool is excluded by the
+    # exact type check; huge ints take the string path, where float() gives inf)
+    value_type = type(value)
+    if value_type is float or (value_type is int and -10**308 < value < 10**308):
+        return round(float(value), 2)
+
     # Convert to string for processing
     value_str = str(value).strip()
 
@@ -94,7 +135,7 @@ def normalize_value_for_comparison(value: Any) -> Any:
             num = float(value_str) / 100
         else:
             # Remove currency symbols and commas
-            cleaned = value_str.replace('$', '').replace(',', '')
+            cleaned = value_str.translate(_CURRENCY_TRANS)
             num = float(cleaned)
 
         # Round to 2 decimal places for comparison
@@ -105,7 +146,7 @@ def normalize_value_for_comparison(value: Any) -> Any:
     # Try to parse as date
     try:
         # ISO format
-        if len(value_str) == 10 and '-' in value_str:
+        if _ISO_DATE_RE.fullmatch(value_str):
             datetime.strptime(value_str, '%Y-%m-%d')
             return value_str  # Already normalized
     except ValueError:
@@ -126,9 +167,19 @@ def compare_values(extracted: Any, expected: Any) -> Tuple[bool, str]:
     Returns:
         Tuple of (is_match, reason)
     """
+    # Equal values of the same type skip normalization (or share it, for
+    # strings). Mixed types are left to normalization: 1 == True, but
+    # "true" != 1.0
+    value_type = type(extracted)
+    if value_type is type(expected) and value_type in _EXACT_MATCH_TYPES and extracted == expected:
+        return True, "Exact match"
+
     # Normalize both values
     norm_extracted = normalize_value_for_comparison(extracted)
-    norm_expected = normalize_value_for_comparison(expected)
+    if value_type is str and extracted == expected:
+        norm_expected = norm_extracted
+    else:
+        norm_expected = normalize_value_for_comparison(expected)
 
     # Direct match
     if norm_extracted == norm_expected:
@@ -185,14 +236,21 @@ def calculate_accuracy(
     metrics = AccuracyMetrics()
     confidence = confidence or {}
 
+    # Per-category counts, gathered in the same pass as the field results
+    category_correct = defaultdict(int)
+    category_total = defaultdict(int)
+
     for field_path, expected_value in gold_standard.items():
         metrics.total_fields += 1
         actual_value = extracted.get(field_path)
+        category = field_path.partition('.')[0]  # e.g., "dates" from "dates.commencement_date"
+        category_total[category] += 1
 
         is_match, reason = compare_values(actual_value, expected_value)
 
         if is_match:
             metrics.correct += 1
+            category_correct[category] += 1
             metrics.field_results[field_path] = {
                 'status': 'correct',
                 'expected': expected_value,
@@ -232,23 +290,45 @@ def calculate_accuracy(
             })
 
     # Calculate per-field accuracy (for aggregating across multiple leases)
-    field_categories = {}
-    for field_path, result in metrics.field_results.items():
-        category = field_path.split('.')[0]  # e.g., "dates" from "dates.commencement_date"
-        if category not in field_categories:
-            field_categories[category] = {'correct': 0, 'total': 0}
-        field_categories[category]['total'] += 1
-        if result['status'] == 'correct':
-            field_categories[category]['correct'] += 1
-
     metrics.per_field_accuracy = {
-        category: round((stats['correct'] / stats['total']) * 100, 2)
-        for category, stats in field_categories.items()
+        category: round((category_correct[category] / total) * 100, 2)
+        for category, total in category_total.items()
     }
 
     return metrics
 
 
+def _extract_one(lease_data: Dict[str, Any], pdf_path: Path) -> Tuple[Dict[str, Any], AccuracyMetrics]:
+    """
+    Extract one lease and score it against its gold standard.
+
+    Args:
+        lease_data: Gold standard entry for the lease
+        pdf_path: Path to the lease PDF
+
+    Returns:
+        Tuple of (result entry for the results file, accuracy metrics)
+    """
+    with open(pdf_path, 'rb') as f:
+        pdf_bytes = f.read()
+
+    result = claude_service.extract_lease_data(pdf_bytes)
+
+    metrics = calculate_accuracy(
+        result['extractions'],
+        lease_data['gold_standard'],
+        result.get('confidence')
+    )
+
+    return {
+        'lease_id': lease_data['lease_id'],
+        'filename': lease_data['filename'],
+        'description': lease_data['description'],
+        'metrics': metrics.to_dict(),
+        'metadata': result['metadata']
+    }, metrics
+
+
 class TestExtractionAccuracy:
     """Test suite for extraction accuracy measurement."""
 
@@ -288,10 +368,10 @@ class TestExtractionAccuracy:
         """
         all_metrics = []
 
+        to_extract = []
         for lease_data in gold_standard_data['leases']:
             lease_id = lease_data['lease_id']
             filename = lease_data['filename']
-            gold_standard = lease_data['gold_standard']
 
             # Skip if PDF not available
             pdf_name = filename.replace('.pdf', '')
@@ -299,47 +379,40 @@ class TestExtractionAccuracy:
                 print(f"Skipping {lease_id}: PDF not found ({filename})")
                 continue
 
-            # Read PDF
-            pdf_path = test_lease_pdfs[pdf_name]
-            with open(pdf_path, 'rb') as f:
-                pdf_bytes = f.read()
-
-            # Extract using Claude
-            print(f"\nExtracting {lease_id}...")
-            result = claude_service.extract_lease_data(pdf_bytes)
-
-            # Calculate accuracy
-            metrics = calculate_accuracy(
-                result['extractions'],
-                gold_standard,
-                result.get('confidence')
-            )
-
-            # Store results
-            all_metrics.append({
-                'lease_id': lease_id,
-                'filename': filename,
-                'description': lease_data['description'],
-                'metrics': metrics.to_dict(),
-                'metadata': result['metadata']
-            })
+            to_extract.append((lease_data, test_lease_pdfs[pdf_name]))
+
+        # Extract using Claude, overlapping the API round trips; map()
+        # yields results in gold standard order
+        with ThreadPoolExecutor(max_workers=EXTRACTION_WORKERS) as executor:
+            extracted = executor.map(lambda args: _extract_one(*args), to_extract)
 
-            # Print summary for this lease
-            print(f"  Accuracy: {metrics.overall_accuracy * 100:.2f}%")
-            print(f"  Correct: {metrics.correct}/{metrics.total_fields}")
-            print(f"  Incorrect: {metrics.incorrect}")
-            print(f"  Missing: {metrics.missing}")
+            for (lease_data, _), (entry, metrics) in zip(to_extract, extracted):
+                # Store results
+                all_metrics.append(entry)
+
+                # Print summary for this lease
+                print(f"\nExtracted {lease_data['lease_id']}")
+                print(f"  Accuracy: {metrics.overall_accuracy * 100:.2f}%")
+                print(f"  Correct: {metrics.correct}/{metrics.total_fields}")
+                print(f"  Incorrect: {metrics.incorrect}")
+                print(f"  Missing: {metrics.missing}")
 
         # Save detailed results
         results_dir = Path(__file__).parent
         results_file = results_dir / 'baseline_results.json'
 
-        with open(results_file, 'w') as f:
-            json.dump({
-                'test_date': datetime.utcnow().isoformat(),
-                'test_type': 'baseline',
-                'results': all_metrics
-            }, f, indent=2)
+        results_data = {
+            'test_date': datetime.utcnow().isoformat(),
+            'test_type': 'baseline',
+            'results': all_metrics
+        }
+        if orjson is not None:
+            option = None if COMPACT_RESULTS else orjson.OPT_INDENT_2
+            with open(results_file, 'wb') as f:
+                f.write(orjson.dumps(results_data, option=option))
+        else:
+            with open(results_file, 'w') as f:
+                json.dump(results_data, f, indent=None if COMPACT_RESULTS else 2)
 
         print(f"\nDetailed results saved to: {results_file}")
 
@@ -118,6 +118,31 @@ def test_db():
         engine.dispose()
 
 
+@pytest.fixture(autouse=True)
+def bbox_cache_dir(tmp_path, monkeypatch):
+    """
+    Give each test its own citation bounding-box disk cache.
+
+    Points BBOX_CACHE_DIR at a per-test directory and drops any cache opened
+    by an earlier test, so runs and workers never share cached boxes.
+
+    Yields:
+        Path of the cache directory
+    """
+    from app.core.config import settings
+    from app.services import pdf_service as pdf_module
+
+    cache_dir = tmp_path / 'bbox_cache'
+    monkeypatch.setattr(settings, 'BBOX_CACHE_DIR', str(cache_dir))
+    monkeypatch.setattr(pdf_module, '_bbox_cache', None)
+    monkeypatch.setattr(pdf_module, '_bbox_cache_failed', False)
+
+    yield cache_dir
+
+    if pdf_module._bbox_cache is not None:
+        pdf_module._bbox_cache.close()
+
+
 # ============================================================================
 # FastAPI Test Client
 # ============================================================================
@@ -193,8 +218,10 @@ def mock_s3_client(mocker):
     # Mock generate_presigned_url
     mock_client.generate_presigned_url.return_value = "https://fake-s3-url.com/test.pdf"
 
-    # Patch boto3.client
+    # Patch boto3.client and drop clients memoized by earlier tests
     mocker.patch('boto3.client', return_value=mock_client)
+    from app.services.storage_service import _build_s3_client
+    _build_s3_client.cache_clear()
     
     # For integration tests: recreate the storage_service singleton with mock
     # Import here to avoid circular imports
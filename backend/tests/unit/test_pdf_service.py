@@ -519,3 +519,250 @@ def test_enrich_citations_with_bounding_boxes_partial_match(sample_pdf_bytes):
     assert 'field1' in result
     assert 'page' in result['field1']
     assert 'quote' in result['field1']
+
+
+@pytest.fixture
+def citation_page():
+    """
+    Build a one-page PDF with two lines of text for citation lookups.
+
+    Yields:
+        Tuple of (fitz page, word index for the page)
+    """
+    import fitz
+    from app.services.pdf_service import _build_word_index
+
+    doc = fitz.open()
+    page = doc.new_page()
+    page.insert_text((72, 72), "LEASE AGREEMENT between Landlord and Tenant")
+    page.insert_text((72, 90), "Base rent is $5,000 per month payable")
+    yield page, _build_word_index(page)
+    doc.close()
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("quote", [
+    "LEASE AGREEMENT",              # whole words
+    "lease   agreement",            # case and whitespace differences
+    "EASE AGREEM",                  # starts and ends mid-word
+    "LEASE AGREEMENT between Land", # quote[:20]-style truncation
+    "and Tenant Base rent",         # spans two lines
+])
+def test_locate_text_matches_search_for(citation_page, quote):
+    """
+    Test that word-index lookups return the same box as page.search_for.
+
+    Verifies:
+    - Whole-word matches come from the index with the same box
+    - Mid-word matches aren't widened to whole words
+    - Multi-line matches return the first line's box
+    """
+    from app.services.pdf_service import _locate_text
+
+    page, index = citation_page
+
+    assert _locate_text(page, index, quote) == page.search_for(quote)[0]
+
+
+@pytest.mark.unit
+def test_locate_text_missing_quote(citation_page):
+    """Test that a quote absent from the page has no bounding box."""
+    from app.services.pdf_service import _find_in_word_index, _locate_text
+
+    page, index = citation_page
+
+    assert _find_in_word_index(index, "security deposit") is None
+    assert _locate_text(page, index, "security deposit") is None
+
+
+@pytest.mark.unit
+def test_word_index_skips_partial_words(citation_page):
+    """Test that the index leaves mid-word matches to search_for."""
+    from app.services.pdf_service import _find_in_word_index
+
+    _, index = citation_page
+
+    assert _find_in_word_index(index, "EASE AGREEM") is None
+    assert _find_in_word_index(index, "LEASE AGREEMENT") is not None
+
+
+@pytest.mark.unit
+def test_enrich_citations_served_from_bbox_cache(mocker, sample_pdf_bytes, bbox_cache_dir):
+    """
+    Test that bounding boxes found once are reused from the disk cache.
+
+    Verifies:
+    - Boxes are stored under (blake2b-128 PDF hash, page, quote)
+    - A repeat call returns the same boxes without opening the PDF
+    """
+    import hashlib
+    from app.services import pdf_service as pdf_module
+
+    citations = {'field1': {'page': 1, 'quote': 'LEASE AGREEMENT'}}
+
+    first = PDFService.enrich_citations_with_bounding_boxes(sample_pdf_bytes, citations)
+    box = first['field1']['bounding_box']
+
+    pdf_hash = hashlib.blake2b(sample_pdf_bytes, digest_size=16).digest()
+    cached = pdf_module.get_bbox_cache().get((pdf_hash, 1, 'LEASE AGREEMENT'))
+    assert cached == (box['x0'], box['y0'], box['x1'], box['y1'])
+    assert bbox_cache_dir.is_dir()
+
+    open_spy = mocker.spy(pdf_module.fitz, 'open')
+    second = PDFService.enrich_citations_with_bounding_boxes(sample_pdf_bytes, citations)
+
+    assert second == first
+    open_spy.assert_not_called()
+
+
+@pytest.mark.unit
+def test_enrich_citations_without_writable_bbox_cache(monkeypatch, tmp_path, sample_pdf_bytes):
+    """
+    Test that an unusable cache directory only disables the disk cache.
+
+    Verifies:
+    - Bounding boxes are still found
+    - The cache is not retried on every call
+    """
+    from app.core.config import settings
+    from app.services import pdf_service as pdf_module
+
+    # A path below a regular file can never be created
+    blocker = tmp_path / 'not-a-dir'
+    blocker.write_text('')
+    monkeypatch.setattr(settings, 'BBOX_CACHE_DIR', str(blocker / 'bbox_cache'))
+
+    citations = {'field1': {'page': 1, 'quote': 'LEASE AGREEMENT'}}
+    result = PDFService.enrich_citations_with_bounding_boxes(sample_pdf_bytes, citations)
+
+    assert 'bounding_box' in result['field1']
+    assert pdf_module.get_bbox_cache() is None
+    assert pdf_module._bbox_cache_failed
+
+
+@pytest.fixture
+def pdf_pool():
+    """
+    Give each test a fresh PDF worker pool and shut it down afterwards.
+
+    Yields:
+        The pdf_service module, for inspecting the pool
+    """
+    from app.services import pdf_service as pdf_module
+
+    pdf_module._pdf_pool = None
+    yield pdf_module
+    if pdf_module._pdf_pool is not None:
+        pdf_module._pdf_pool.shutdown()
+        pdf_module._pdf_pool = None
+
+
+def _break_pool(pool):
+    """Kill a worker so the pool raises BrokenProcessPool from then on."""
+    import os
+    from concurrent.futures.process import BrokenProcessPool
+
+    with pytest.raises(BrokenProcessPool):
+        pool.submit(os._exit, 1).result()
+
+
+@pytest.mark.unit
+async def test_extract_text_from_bytes_async(sample_pdf_bytes, pdf_pool):
+    """
+    Test text extraction in the worker pool.
+
+    Verifies:
+    - Result matches the synchronous call
+    - The pool is created on first use
+    """
+    result = await pdf_service.extract_text_from_bytes_async(sample_pdf_bytes)
+
+    assert result == PDFService.extract_text_from_bytes(sample_pdf_bytes)
+    assert pdf_pool._pdf_pool is not None
+
+
+@pytest.mark.unit
+async def test_search_text_in_pdf_async(sample_pdf_bytes, pdf_pool):
+    """Test that searching in the worker pool matches the synchronous call."""
+    result = await pdf_service.search_text_in_pdf_async(sample_pdf_bytes, 'LEASE', 1)
+
+    assert result == PDFService.search_text_in_pdf(sample_pdf_bytes, 'LEASE', 1)
+
+
+@pytest.mark.unit
+async def test_enrich_citations_with_bounding_boxes_async(sample_pdf_bytes, pdf_pool):
+    """Test that citation enrichment in the worker pool matches the synchronous call."""
+    citations = {'field1': {'page': 1, 'quote': 'LEASE AGREEMENT'}}
+
+    result = await pdf_service.enrich_citations_with_bounding_boxes_async(
+        sample_pdf_bytes, citations
+    )
+
+    assert result == PDFService.enrich_citations_with_bounding_boxes(sample_pdf_bytes, citations)
+
+
+@pytest.mark.unit
+async def test_async_wrapper_recovers_from_broken_pool(sample_pdf_bytes, pdf_pool):
+    """
+    Test that a crashed worker doesn't break later calls.
+
+    Verifies:
+    - The call is retried and succeeds
+    - The broken pool is replaced on the next call
+    """
+    broken = pdf_pool.get_pdf_pool()
+    _break_pool(broken)
+
+    result = await pdf_service.extract_text_from_bytes_async(sample_pdf_bytes)
+
+    assert result['page_count'] > 0
+    assert pdf_pool._pdf_pool is None
+
+    await pdf_service.extract_text_from_bytes_async(sample_pdf_bytes)
+
+    assert pdf_pool._pdf_pool not in (None, broken)
+
+
+@pytest.mark.unit
+async def test_async_wrapper_retries_only_once(pdf_pool):
+    """
+    Test that work which crashes every worker fails after one retry.
+
+    Verifies:
+    - BrokenProcessPool is raised
+    - The retry runs outside the shared pool, so only one shared pool is
+      broken and it is discarded for the next call
+    """
+    import os
+    from concurrent.futures.process import BrokenProcessPool
+
+    with pytest.raises(BrokenProcessPool):
+        await pdf_pool._run_in_pdf_pool(os._exit, 1)
+
+    assert pdf_pool._pdf_pool is None
+
+
+@pytest.mark.unit
+async def test_async_wrapper_bystanders_survive_crash(pdf_pool):
+    """
+    Test that calls in flight when another call crashes a worker succeed.
+
+    Verifies:
+    - The crashing call raises BrokenProcessPool
+    - A concurrent call is retried and returns its result
+    - No replacement shared pool is broken by the retries
+    """
+    import asyncio
+    import os
+    import time
+    from concurrent.futures.process import BrokenProcessPool
+
+    crashed, slept = await asyncio.gather(
+        pdf_pool._run_in_pdf_pool(os._exit, 1),
+        pdf_pool._run_in_pdf_pool(time.sleep, 0.5),
+        return_exceptions=True,
+    )
+
+    assert isinstance(crashed, BrokenProcessPool)
+    assert slept is None
+    assert pdf_pool._pdf_pool is None
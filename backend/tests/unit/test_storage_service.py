@@ -35,7 +35,7 @@ def test_upload_pdf_success(mocker, mock_s3_client):
     """
     # Mock UUID for predictable filenames
     mock_uuid = mocker.MagicMock()
-    mock_uuid.__str__ = mocker.MagicMock(return_value="test-uuid-12345")
+    mock_uuid.hex = "test-uuid-12345"
     mocker.patch('uuid.uuid4', return_value=mock_uuid)
 
     # Create storage service with S3 backend
@@ -66,6 +66,35 @@ def test_upload_pdf_success(mocker, mock_s3_client):
     assert extra_args['ServerSideEncryption'] == 'AES256'
 
 
+@pytest.mark.unit
+@pytest.mark.parametrize("original_filename, expected_ext", [
+    ("lease.pdf", ".pdf"),
+    ("scans/lease.v2.pdf", ".pdf"),
+    ("a.b/c", ""),
+    ("a.b\\c", ""),
+    (".bashrc", ""),
+    ("noext", ""),
+])
+def test_upload_pdf_key_extension(mocker, mock_s3_client, original_filename, expected_ext):
+    """
+    Test that only the filename's own extension is kept in the storage key.
+
+    Verifies:
+    - Directories in the client-supplied name don't contribute an extension
+    - The key never contains a path separator beyond the prefix
+    """
+    mock_uuid = mocker.MagicMock()
+    mock_uuid.hex = "test-uuid-12345"
+    mocker.patch('uuid.uuid4', return_value=mock_uuid)
+
+    storage = _create_test_storage_service()
+
+    result = storage.upload_pdf(BytesIO(b"test pdf content"), original_filename)
+
+    assert result['filename'] == "test-uuid-12345" + expected_ext
+    assert result['file_path'] == "leases/test-uuid-12345" + expected_ext
+
+
 @pytest.mark.unit
 def test_upload_pdf_failure(mocker, mock_s3_client):
     """
@@ -98,7 +127,7 @@ def test_upload_pdf_preserves_extension(mocker, mock_s3_client):
     Verifies different file extensions (.pdf, .PDF) are maintained.
     """
     mock_uuid = mocker.MagicMock()
-    mock_uuid.__str__ = mocker.MagicMock(return_value="abc123")
+    mock_uuid.hex = "abc123"
     mocker.patch('uuid.uuid4', return_value=mock_uuid)
 
     storage = _create_test_storage_service()
@@ -161,6 +190,52 @@ def test_download_pdf_failure(mock_s3_client):
     assert "Failed to download file from S3" in str(exc_info.value)
 
 
+@pytest.mark.unit
+def test_download_pdf_stream(mock_s3_client):
+    """
+    Test streaming a PDF download from S3.
+
+    Verifies:
+    - get_object is issued before iteration starts
+    - Body is read in chunks of the requested size
+    """
+    mock_body = mock_s3_client.get_object.return_value['Body']
+    mock_body.iter_chunks.return_value = iter([b'%PDF-1.4\n', b'%fake'])
+
+    storage = _create_test_storage_service()
+    stream = storage.download_pdf_stream("leases/test-file.pdf", chunk_size=1024)
+
+    mock_s3_client.get_object.assert_called_once_with(
+        Bucket=storage.bucket_name,
+        Key="leases/test-file.pdf"
+    )
+    assert b''.join(stream) == b'%PDF-1.4\n%fake'
+    mock_body.iter_chunks.assert_called_once_with(chunk_size=1024)
+    mock_body.close.assert_called_once()
+
+
+@pytest.mark.unit
+def test_download_pdf_stream_closed_early(mock_s3_client):
+    """
+    Test that abandoning a streamed download closes the S3 body.
+
+    Verifies:
+    - Closing the iterator after one chunk closes the StreamingBody
+    """
+    mock_body = mock_s3_client.get_object.return_value['Body']
+    mock_body.iter_chunks.return_value = iter([b'%PDF-1.4\n', b'%fake'])
+
+    storage = _create_test_storage_service()
+    stream = storage.download_pdf_stream("leases/test-file.pdf", chunk_size=1024)
+
+    assert next(stream) == b'%PDF-1.4\n'
+    mock_body.close.assert_not_called()
+
+    stream.close()
+
+    mock_body.close.assert_called_once()
+
+
 @pytest.mark.unit
 def test_delete_pdf_success(mock_s3_client):
     """
@@ -206,6 +281,34 @@ def test_delete_pdf_failure(mock_s3_client):
     assert "Failed to delete file from S3" in str(exc_info.value)
 
 
+@pytest.mark.unit
+def test_delete_many_pdfs_batches_keys(mock_s3_client):
+    """
+    Test bulk deletion from S3.
+
+    Verifies:
+    - Keys are sent through delete_objects in batches of 1000
+    - Per-key errors reported by S3 raise an exception
+    """
+    mock_s3_client.delete_objects.return_value = {}
+    storage = _create_test_storage_service()
+    keys = [f"leases/file-{i}.pdf" for i in range(1500)]
+
+    assert storage.delete_many_pdfs(keys) is True
+
+    batches = [c[1]['Delete']['Objects'] for c in mock_s3_client.delete_objects.call_args_list]
+    assert [len(batch) for batch in batches] == [1000, 500]
+    assert batches[1][-1] == {'Key': "leases/file-1499.pdf"}
+
+    mock_s3_client.delete_objects.return_value = {
+        'Errors': [{'Key': "leases/file-0.pdf", 'Code': 'AccessDenied'}]
+    }
+    with pytest.raises(Exception) as exc_info:
+        storage.delete_many_pdfs(["leases/file-0.pdf"])
+
+    assert "leases/file-0.pdf" in str(exc_info.value)
+
+
 @pytest.mark.unit
 def test_get_presigned_url_success(mock_s3_client):
     """
@@ -248,6 +351,73 @@ def test_get_presigned_url_success(mock_s3_client):
     )
 
 
+@pytest.mark.unit
+def test_get_presigned_url_cached(mock_s3_client):
+    """
+    Test that repeated presigned URL requests reuse the signed URL.
+    """
+    storage = _create_test_storage_service()
+
+    first = storage.get_presigned_url("leases/test-file.pdf")
+    second = storage.get_presigned_url("leases/test-file.pdf")
+
+    assert first == second
+    mock_s3_client.generate_presigned_url.assert_called_once()
+
+
+@pytest.mark.unit
+def test_get_presigned_url_with_expiry_reports_remaining(mocker, mock_s3_client):
+    """
+    Test that cached presigned URLs report their real remaining lifetime.
+
+    Verifies:
+    - A fresh URL reports the full expiration
+    - A cached URL reports the time it has left
+    - URLs past half their lifetime are re-signed
+    """
+    clock = mocker.patch('app.services.storage_service.time')
+    clock.monotonic.return_value = 1000.0
+    storage = _create_test_storage_service()
+
+    assert storage.get_presigned_url_with_expiry("leases/test-file.pdf") == (
+        "https://fake-s3-url.com/test.pdf", 3600
+    )
+
+    clock.monotonic.return_value = 2000.0
+    _, expires_in = storage.get_presigned_url_with_expiry("leases/test-file.pdf")
+    assert expires_in == 2600
+    mock_s3_client.generate_presigned_url.assert_called_once()
+
+    clock.monotonic.return_value = 2801.0
+    _, expires_in = storage.get_presigned_url_with_expiry("leases/test-file.pdf")
+    assert expires_in == 3600
+    assert mock_s3_client.generate_presigned_url.call_count == 2
+
+
+@pytest.mark.unit
+def test_get_presigned_url_skips_nearly_expired(mocker, mock_s3_client):
+    """
+    Test that a cached URL is never handed out with under a minute left.
+    """
+    clock = mocker.patch('app.services.storage_service.time')
+    clock.monotonic.return_value = 0.0
+    storage = _create_test_storage_service()
+
+    storage.get_presigned_url("leases/test-file.pdf", expiration=100)
+
+    # 70s left: still above the one-minute floor
+    clock.monotonic.return_value = 30.0
+    _, expires_in = storage.get_presigned_url_with_expiry("leases/test-file.pdf", expiration=100)
+    assert expires_in == 70
+    mock_s3_client.generate_presigned_url.assert_called_once()
+
+    # 59s left: re-signed
+    clock.monotonic.return_value = 41.0
+    _, expires_in = storage.get_presigned_url_with_expiry("leases/test-file.pdf", expiration=100)
+    assert expires_in == 100
+    assert mock_s3_client.generate_presigned_url.call_count == 2
+
+
 @pytest.mark.unit
 def test_get_presigned_url_failure(mock_s3_client):
     """
@@ -294,7 +464,7 @@ def test_filename_uniqueness(mocker, mock_s3_client):
     mock_uuids = []
     for i in range(3):
         mock = mocker.MagicMock()
-        mock.__str__ = mocker.MagicMock(return_value=f"uuid-{i}")
+        mock.hex = f"uuid-{i}"
         mock_uuids.append(mock)
 
     uuid_call_count = [0]
@@ -330,7 +500,7 @@ def test_s3_key_format(mocker, mock_s3_client):
     This ensures consistent file organization in S3.
     """
     mock_uuid = mocker.MagicMock()
-    mock_uuid.__str__ = mocker.MagicMock(return_value="test-123")
+    mock_uuid.hex = "test-123"
     mocker.patch('uuid.uuid4', return_value=mock_uuid)
 
     storage = _create_test_storage_service()
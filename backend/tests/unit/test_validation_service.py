@@ -0,0 +1,138 @@
+"""
+Unit tests for the validation service.
+
+These tests verify per-type normalization and the batch validation
+pass used after extraction.
+"""
+import pytest
+
+from app.services.validation_service import ValidationService
+
+
+@pytest.mark.unit
+def test_validate_all_normalizes_by_type():
+    """
+    Test batch validation of mixed field types.
+
+    Verifies:
+    - Each field is normalized by the validator for its type
+    - Results preserve the input field order
+    - None values pass through without warnings
+    """
+    service = ValidationService()
+
+    results = service.validate_all({
+        'dates.commencement_date': ('January 1, 2024', 'date'),
+        'rent.base_rent_monthly': ('$1,000.00', 'currency'),
+        'property.rentable_area': ('2,500 SF', 'area'),
+        'provisions.renewal_option': ('Yes', 'boolean'),
+        'parties.tenant_name': (None, 'text'),
+    })
+
+    assert list(results) == [
+        'dates.commencement_date',
+        'rent.base_rent_monthly',
+        'property.rentable_area',
+        'provisions.renewal_option',
+        'parties.tenant_name',
+    ]
+    assert results['dates.commencement_date'].value == '2024-01-01'
+    assert results['rent.base_rent_monthly'].value == 1000.0
+    assert results['property.rentable_area'].value == 2500.0
+    assert results['provisions.renewal_option'].value is True
+    assert results['parties.tenant_name'].value is None
+    assert results['parties.tenant_name'].warnings == []
+
+
+@pytest.mark.unit
+def test_validate_all_checks_consistency_on_normalized_values():
+    """
+    Test that cross-field checks see every field after normalization.
+
+    The commencement date arrives in US format after the expiration date,
+    so the check only works if it runs once all dates are normalized.
+    """
+    service = ValidationService()
+
+    results = service.validate_all({
+        'dates.expiration_date': ('2023-12-31', 'date'),
+        'dates.commencement_date': ('01/01/2024', 'date'),
+    })
+
+    expiration = results['dates.expiration_date']
+    assert "Expiration date should be after commencement date" in expiration.warnings
+    assert expiration.confidence_adjustment == pytest.approx(-0.1)
+
+
+@pytest.mark.unit
+def test_validate_all_uses_unvalidated_extractions_for_consistency():
+    """
+    Test that fields outside the batch still feed consistency checks.
+    """
+    service = ValidationService()
+
+    results = service.validate_all(
+        {'rent.base_rent_annual': ('$24,000', 'currency')},
+        all_extractions={'rent.base_rent_monthly': 1000},
+    )
+
+    assert any("doesn't match" in w for w in results['rent.base_rent_annual'].warnings)
+
+
+@pytest.mark.unit
+def test_validate_date_formats():
+    """
+    Test date normalization for the supported input formats.
+    """
+    service = ValidationService()
+
+    assert service.validate_date('2024-01-15', 'dates.x').value == '2024-01-15'
+    assert service.validate_date('01/15/2024', 'dates.x').value == '2024-01-15'
+    assert service.validate_date('15/01/2024', 'dates.x').value == '2024-01-15'
+    assert service.validate_date('1/15/24', 'dates.x').value == '2024-01-15'
+    assert service.validate_date('Jan 15, 2024', 'dates.x').value == '2024-01-15'
+    assert service.validate_date('20240115', 'dates.x').value == '2024-01-15'
+
+    invalid = service.validate_date('2024-13-45', 'dates.x')
+    assert invalid.value is None
+    assert invalid.confidence_adjustment == pytest.approx(-0.2)
+
+
+@pytest.mark.unit
+def test_validate_leases_parallel_matches_serial():
+    """
+    Test that parallel bulk validation returns the serial results in order.
+    """
+    service = ValidationService()
+    leases = [
+        {
+            'dates.commencement_date': (f'01/{day:02d}/2024', 'date'),
+            'rent.base_rent_monthly': (f'${day},000', 'currency'),
+        }
+        for day in range(1, 6)
+    ]
+
+    results = service.validate_leases_parallel(leases, workers=2)
+
+    assert len(results) == len(leases)
+    for lease, result in zip(leases, results):
+        expected = service.validate_all(lease)
+        assert {p: r.value for p, r in result.items()} == {p: r.value for p, r in expected.items()}
+    assert results[2]['dates.commencement_date'].value == '2024-01-03'
+
+
+@pytest.mark.unit
+def test_check_consistency_date_shapes():
+    """
+    Test that consistency checks parse raw dates like strptime('%Y-%m-%d').
+
+    Unpadded ISO dates are compared; compact and ISO-week dates are not.
+    """
+    service = ValidationService()
+
+    assert service.check_consistency(
+        'dates.expiration_date', '2023-1-5', {'dates.commencement_date': '2024-1-5'}
+    ) == ["Expiration date should be after commencement date"]
+    assert service.check_consistency(
+        'dates.expiration_date', '20230105', {'dates.commencement_date': '2024-W03-1'}
+    ) == []